@@ -34,3 +34,21 @@ class Asset(BaseModel):
 
     platform: Platform
     identifier: Any
+
+    # Cache set in model_post_init on the frozen model.
+    _value_str: str = ""
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the identifier's string form.
+
+        Balance snapshots key their result dicts by this string for every
+        tracked asset, so it is resolved once here instead of walking the
+        ``identifier`` attribute chain per lookup.
+        """
+        object.__setattr__(self, "_value_str", str(self.identifier))
+
+    @property
+    def value_str(self) -> str:
+        """Get the cached string form of the asset identifier."""
+        value: str = self._value_str
+        return value
@@ -1,4 +1,7 @@
-from pydantic import BaseModel, ConfigDict
+import sys
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, field_validator
 
 
 class AssetIdentifier(BaseModel):
@@ -22,6 +25,23 @@ class AssetIdentifier(BaseModel):
 
     value: str
 
+    # Cache set in model_post_init on the frozen model.
+    _hash: int = 0
+
+    @field_validator("value")
+    @classmethod
+    def intern_value(cls, v: str) -> str:
+        """Intern the identifier string.
+
+        Identifiers come from a small vocabulary and are compared constantly
+        as dict/set keys, so interning makes equality a pointer comparison.
+        """
+        return sys.intern(v)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the hash, since the identifier is immutable."""
+        object.__setattr__(self, "_hash", hash(self.value))
+
     def __str__(self) -> str:
         """Get the string representation of the asset identifier.
 
@@ -44,4 +64,5 @@ class AssetIdentifier(BaseModel):
         return NotImplemented
 
     def __hash__(self) -> int:
-        return hash(self.value)
+        cached: int = self._hash
+        return cached
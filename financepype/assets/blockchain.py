@@ -1,4 +1,5 @@
 from decimal import Decimal
+from functools import lru_cache
 
 from pydantic import BaseModel, ConfigDict
 
@@ -7,6 +8,16 @@ from financepype.operators.blockchains.identifier import BlockchainIdentifier
 from financepype.platforms.blockchain import BlockchainPlatform
 
 
+@lru_cache(maxsize=64)
+def _scale(decimals: int) -> Decimal:
+    """Return the Decimal scale factor (10**decimals) for a given precision.
+
+    The factor is invariant for a given number of decimals, so it is
+    memoized instead of being rebuilt on every conversion.
+    """
+    return Decimal(10) ** decimals
+
+
 class BlockchainAssetData(BaseModel):
     """Data specific to blockchain assets.
 
@@ -62,7 +73,7 @@ class BlockchainAsset(Asset):
         Returns:
             Decimal: The amount converted to decimal representation
         """
-        return Decimal(raw_amount) / Decimal(10**self.data.decimals)
+        return Decimal(raw_amount) / _scale(self.data.decimals)
 
     def convert_to_raw(self, decimal_amount: Decimal) -> int:
         """Convert decimal amount to raw token units.
@@ -73,4 +84,4 @@ class BlockchainAsset(Asset):
         Returns:
             int: The amount converted to raw token units
         """
-        return int(decimal_amount * 10**self.data.decimals)
+        return int(decimal_amount * _scale(self.data.decimals))
@@ -36,15 +36,21 @@ class DerivativeContract(CentralizedAsset):
 
     side: DerivativeSide
 
+    # Cache set in model_post_init, avoiding a TradingPair parse per access.
+    _trading_pair: TradingPair | None = None
+
     def model_post_init(self, __context: Any) -> None:
         """Post-initialization validation.
 
-        Performs additional validation after the model is initialized.
+        Performs additional validation after the model is initialized and
+        caches the trading pair, since the identifier is immutable and has
+        already been validated.
 
         Args:
             __context (Any): The initialization context
         """
         super().model_post_init(__context)
+        object.__setattr__(self, "_trading_pair", TradingPair(name=self.symbol))
 
     @field_validator("identifier")
     @classmethod
@@ -87,9 +93,12 @@ class DerivativeContract(CentralizedAsset):
         """Get the trading pair associated with this contract.
 
         Returns:
-            TradingPair: The trading pair object
+            TradingPair: The trading pair object, cached at construction time
         """
-        return TradingPair(name=self.symbol)
+        trading_pair = self._trading_pair
+        if trading_pair is None:  # pragma: no cover - set in model_post_init
+            trading_pair = TradingPair(name=self.symbol)
+        return trading_pair
 
     @property
     def market_info(self) -> MarketInfo:
@@ -77,6 +77,36 @@ class FundingPayment(BaseModel):
         """
         return self.amount if self.is_received else -self.amount
 
+    @classmethod
+    def from_feed(
+        cls,
+        trading_pair: TradingPair,
+        amount: Decimal,
+        is_received: bool,
+        timestamp: int,
+        settlement_token: str,
+        funding_id: str,
+        exchange_symbol: str | None = None,
+    ) -> "FundingPayment":
+        """Build a funding payment from an already-sanitized feed payload.
+
+        Trusted-input fast path for high-volume payment streams: skips
+        pydantic validation via model_construct. Use the regular
+        constructor for user or external input.
+
+        Returns:
+            FundingPayment: The constructed payment
+        """
+        return cls.model_construct(
+            trading_pair=trading_pair,
+            amount=amount,
+            is_received=is_received,
+            timestamp=timestamp,
+            settlement_token=settlement_token,
+            funding_id=funding_id,
+            exchange_symbol=exchange_symbol,
+        )
+
 
 class FundingInfo(BaseModel):
     """Information about funding for a perpetual market.
@@ -143,22 +173,26 @@ class FundingInfo(BaseModel):
         Args:
             info_update (FundingInfoUpdate): New funding information
         """
-        if info_update.index_price is not None:
-            self.index_price = info_update.index_price
-        if info_update.mark_price is not None:
-            self.mark_price = info_update.mark_price
-        if info_update.next_funding_utc_timestamp is not None:
+        index_price = info_update.index_price
+        if index_price is not None:
+            self.index_price = index_price
+        mark_price = info_update.mark_price
+        if mark_price is not None:
+            self.mark_price = mark_price
+        next_funding_utc_timestamp = info_update.next_funding_utc_timestamp
+        if next_funding_utc_timestamp is not None:
             if (
                 self.next_funding_utc_timestamp is not None
-                and info_update.next_funding_utc_timestamp
-                > self.next_funding_utc_timestamp
+                and next_funding_utc_timestamp > self.next_funding_utc_timestamp
             ):
                 self.last_funding_utc_timestamp = self.next_funding_utc_timestamp
-            self.next_funding_utc_timestamp = info_update.next_funding_utc_timestamp
-        if info_update.next_funding_rate is not None:
-            self.next_funding_rate = info_update.next_funding_rate
-        if info_update.last_funding_rate is not None:
-            self.last_funding_rate = info_update.last_funding_rate
+            self.next_funding_utc_timestamp = next_funding_utc_timestamp
+        next_funding_rate = info_update.next_funding_rate
+        if next_funding_rate is not None:
+            self.next_funding_rate = next_funding_rate
+        last_funding_rate = info_update.last_funding_rate
+        if last_funding_rate is not None:
+            self.last_funding_rate = last_funding_rate
 
     def get_next_payment_rates(
         self,
@@ -189,14 +223,16 @@ class FundingInfo(BaseModel):
         ):
             return None
 
-        if self.payment_seconds_interval is None:
+        # Compute the payment interval once; it is re-used three times below.
+        payment_seconds_interval = self.payment_seconds_interval
+        if payment_seconds_interval is None:
             return None
 
         # Calculate the format and normalized rate
         output_seconds_format: int = (
             payment_seconds_format
             if payment_seconds_format is not None
-            else self.payment_seconds_interval
+            else payment_seconds_interval
         )
         last_payment = closing_time or self.next_funding_utc_timestamp
         if last_payment is None:
@@ -207,7 +243,7 @@ class FundingInfo(BaseModel):
             if self.payment_type == FundingPaymentType.NEXT
             else self.last_funding_rate
         )
-        rate = (rate / self.payment_seconds_interval) * output_seconds_format
+        rate = (rate / payment_seconds_interval) * output_seconds_format
         payments = {}
 
         # In case the funding is live, we need to calculate the payments for the live funding
@@ -217,11 +253,22 @@ class FundingInfo(BaseModel):
                 // self.live_payment_frequency
                 * self.live_payment_frequency
             ) + self.live_payment_frequency
-            rate = rate / (self.payment_seconds_interval // self.live_payment_frequency)
-            for time in range(
+            rate = rate / (payment_seconds_interval // self.live_payment_frequency)
+            payment_times: range | list[int] = range(
                 int(first_payment), int(last_payment), self.live_payment_frequency
-            ):
-                payments[time] = rate
+            )
+            # Vectorize the timestamp enumeration for long horizons; the numpy
+            # call overhead is not worth it for a handful of payments.
+            if len(payment_times) >= 32:
+                import numpy as np
+
+                payment_times = np.arange(
+                    int(first_payment),
+                    int(last_payment),
+                    self.live_payment_frequency,
+                    dtype=np.int64,
+                ).tolist()
+            payments = dict.fromkeys(payment_times, rate)
 
         # Add the last payment if it is the same as the next funding time
         if (
@@ -1,3 +1,4 @@
+import bisect
 import functools
 from collections import OrderedDict
 from datetime import datetime
@@ -69,6 +70,21 @@ INSTRUMENT_TIMEFRAME_INTERVAL = OrderedDict(
     ]
 )
 
+# Parallel tuples over the (sorted) interval mapping for binary search.
+_TIMEFRAME_DURATIONS = tuple(INSTRUMENT_TIMEFRAME_INTERVAL.keys())
+_TIMEFRAME_TYPES = tuple(INSTRUMENT_TIMEFRAME_INTERVAL.values())
+
+
+def _parse_expiry_date(value: str) -> datetime:
+    """Parse a %Y%m%d expiry string without the generic strptime machinery.
+
+    Falls back to strptime for malformed inputs so error behavior is
+    unchanged.
+    """
+    if len(value) == 8 and value.isdigit():
+        return datetime(int(value[:4]), int(value[4:6]), int(value[6:8]))
+    return datetime.strptime(value, "%Y%m%d")
+
 
 class MarketType(Enum):
     """Enumeration of financial instrument types.
@@ -103,6 +119,9 @@ class MarketType(Enum):
     PUT_SPREAD = "PUT_SPREAD"
     VOLATILITY = "VOLATILITY"
 
+    # Category bitmask, assigned at import time from the category sets below.
+    _flags: int
+
     @property
     def is_spot(self) -> bool:
         """Check if the instrument is a spot trading instrument.
@@ -110,7 +129,7 @@ class MarketType(Enum):
         Returns:
             bool: True if spot trading instrument, False otherwise
         """
-        return self in _SPOT_TYPES
+        return bool(self._flags & _SPOT_FLAG)
 
     @property
     def is_derivative(self) -> bool:
@@ -119,7 +138,7 @@ class MarketType(Enum):
         Returns:
             bool: True if derivative instrument, False otherwise
         """
-        return self not in _SPOT_TYPES
+        return not self._flags & _SPOT_FLAG
 
     @property
     def is_perpetual(self) -> bool:
@@ -128,7 +147,7 @@ class MarketType(Enum):
         Returns:
             bool: True if perpetual contract, False otherwise
         """
-        return self in _PERPETUAL_TYPES
+        return bool(self._flags & _PERPETUAL_FLAG)
 
     @property
     def is_future(self) -> bool:
@@ -137,7 +156,7 @@ class MarketType(Enum):
         Returns:
             bool: True if futures contract, False otherwise
         """
-        return self in _FUTURE_TYPES
+        return bool(self._flags & _FUTURE_FLAG)
 
     @property
     def is_option(self) -> bool:
@@ -146,7 +165,7 @@ class MarketType(Enum):
         Returns:
             bool: True if option contract, False otherwise
         """
-        return self in _OPTION_TYPES
+        return bool(self._flags & _OPTION_FLAG)
 
     @property
     def is_inverse(self) -> bool:
@@ -155,7 +174,7 @@ class MarketType(Enum):
         Returns:
             bool: True if inverse contract, False otherwise
         """
-        return self in _INVERSE_TYPES
+        return bool(self._flags & _INVERSE_FLAG)
 
     @property
     def is_linear(self) -> bool:
@@ -164,7 +183,7 @@ class MarketType(Enum):
         Returns:
             bool: True if linear contract, False otherwise
         """
-        return self in _LINEAR_TYPES
+        return bool(self._flags & _LINEAR_FLAG)
 
 
 _SPOT_TYPES = frozenset({MarketType.SPOT})
@@ -203,6 +222,26 @@ _LINEAR_TYPES = frozenset(
     }
 )
 
+_SPOT_FLAG = 1 << 0
+_PERPETUAL_FLAG = 1 << 1
+_FUTURE_FLAG = 1 << 2
+_OPTION_FLAG = 1 << 3
+_INVERSE_FLAG = 1 << 4
+_LINEAR_FLAG = 1 << 5
+
+# Collapse the category sets into a per-member bitmask so the is_* properties
+# reduce to a single AND instead of a hash lookup.
+for _member in MarketType:
+    _member._flags = (
+        (_SPOT_FLAG if _member in _SPOT_TYPES else 0)
+        | (_PERPETUAL_FLAG if _member in _PERPETUAL_TYPES else 0)
+        | (_FUTURE_FLAG if _member in _FUTURE_TYPES else 0)
+        | (_OPTION_FLAG if _member in _OPTION_TYPES else 0)
+        | (_INVERSE_FLAG if _member in _INVERSE_TYPES else 0)
+        | (_LINEAR_FLAG if _member in _LINEAR_TYPES else 0)
+    )
+del _member
+
 
 class MarketInfo(BaseModel):
     """Information about a trading market/instrument.
@@ -321,20 +360,66 @@ class MarketInfo(BaseModel):
         if delivery_timestamp < 0:
             return MarketTimeframe.UNDEFINED
 
+        adjusted_duration = instrument_duration - instrument_timeframe_tolerance
         if not next_timeframe:
-            for duration, timeframe_type in INSTRUMENT_TIMEFRAME_INTERVAL.items():
-                if instrument_duration <= duration + instrument_timeframe_tolerance:
-                    return timeframe_type
+            # Smallest duration such that adjusted_duration <= duration
+            index = bisect.bisect_left(_TIMEFRAME_DURATIONS, adjusted_duration)
+            if index < len(_TIMEFRAME_TYPES):
+                return _TIMEFRAME_TYPES[index]
         else:
-            for duration, timeframe_type in reversed(
-                INSTRUMENT_TIMEFRAME_INTERVAL.items()
-            ):
-                if instrument_duration >= duration + instrument_timeframe_tolerance:
-                    return timeframe_type
+            # Largest duration such that adjusted_duration >= duration
+            index = bisect.bisect_right(_TIMEFRAME_DURATIONS, adjusted_duration) - 1
+            if index >= 0:
+                return _TIMEFRAME_TYPES[index]
 
         return MarketTimeframe.UNDEFINED
 
     @classmethod
+    def get_timeframe_types(
+        cls,
+        launch_timestamps: Any,
+        delivery_timestamps: Any,
+        instrument_timeframe_tolerance: int = 0,
+        next_timeframe: bool = False,
+    ) -> list[MarketTimeframe]:
+        """Classify many instrument durations at once.
+
+        Vectorized counterpart of get_timeframe_type for bulk instrument
+        onboarding (e.g. thousands of contracts on exchange connect); the
+        binary searches run as a single NumPy searchsorted call.
+
+        Args:
+            launch_timestamps: Array-like of instrument launch timestamps
+            delivery_timestamps: Array-like of delivery/expiry timestamps
+            instrument_timeframe_tolerance (int): Allowed tolerance in seconds
+            next_timeframe (bool): Whether to get next larger timeframe
+
+        Returns:
+            list[MarketTimeframe]: One timeframe type per instrument
+        """
+        import numpy as np
+
+        launches = np.asarray(launch_timestamps, dtype=np.int64)
+        deliveries = np.asarray(delivery_timestamps, dtype=np.int64)
+        adjusted = deliveries - launches - instrument_timeframe_tolerance
+
+        durations = np.asarray(_TIMEFRAME_DURATIONS, dtype=np.int64)
+        if not next_timeframe:
+            indices = np.searchsorted(durations, adjusted, side="left")
+            out_of_range = indices >= len(_TIMEFRAME_TYPES)
+        else:
+            indices = np.searchsorted(durations, adjusted, side="right") - 1
+            out_of_range = indices < 0
+        undefined = out_of_range | (deliveries < 0)
+        indices = np.where(undefined, 0, indices)
+
+        return [
+            MarketTimeframe.UNDEFINED if invalid else _TIMEFRAME_TYPES[index]
+            for index, invalid in zip(indices.tolist(), undefined.tolist(), strict=True)
+        ]
+
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
     def split_client_instrument_name(cls, name: str) -> Self:
         """Parse a client instrument name into its components.
 
@@ -342,6 +427,9 @@ class MarketInfo(BaseModel):
         The name format should follow:
         {base}-{quote}{type}{timeframe}{expiry}{strike}
 
+        The parse (including validation) is cached per name, so repeat
+        resolutions of the same symbol are a single dict lookup.
+
         Args:
             name (str): The instrument name to parse
 
@@ -370,9 +458,7 @@ class MarketInfo(BaseModel):
                 if len(split) > 3
                 else MarketTimeframe.UNDEFINED
             )
-            expiry_date = (
-                datetime.strptime(split[4], "%Y%m%d") if len(split) > 4 else None
-            )
+            expiry_date = _parse_expiry_date(split[4]) if len(split) > 4 else None
             if market_type in [
                 MarketType.CALL_OPTION,
                 MarketType.PUT_OPTION,
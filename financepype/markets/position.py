@@ -1,9 +1,13 @@
 from decimal import Decimal
+from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
 
 from financepype.assets.contract import DerivativeContract, DerivativeSide
-from financepype.constants import s_decimal_0, s_decimal_inf
+from financepype.constants import s_decimal_0, s_decimal_100, s_decimal_inf
+
+_DEFAULT_RISK_PERCENTAGE = Decimal("95")
+_DEFAULT_RISK_FRACTION = Decimal("0.95")
 
 
 class Position(BaseModel):
@@ -32,6 +36,17 @@ class Position(BaseModel):
     unrealized_pnl: Decimal = Field(allow_inf_nan=True)
     liquidation_price: Decimal = Field(ge=s_decimal_0)
 
+    # Cached at construction: +1 for long, -1 for short.
+    _side_sign: int = 0
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the side sign used for branchless distance math."""
+        object.__setattr__(
+            self,
+            "_side_sign",
+            1 if self.asset.side == DerivativeSide.LONG else -1,
+        )
+
     @field_validator("liquidation_price", mode="before")
     def validate_liquidation_price(cls, v: Decimal) -> Decimal:
         """Validate and normalize the liquidation price.
@@ -51,7 +66,7 @@ class Position(BaseModel):
         Returns:
             Decimal: Percentage PnL relative to margin
         """
-        return self.unrealized_pnl / self.margin * Decimal("100")
+        return self.unrealized_pnl / self.margin * s_decimal_100
 
     @property
     def value(self) -> Decimal:
@@ -105,6 +120,16 @@ class Position(BaseModel):
         """
         return self.asset.side
 
+    @property
+    def side_sign(self) -> int:
+        """Numeric side of the position: +1 for long, -1 for short.
+
+        Returns:
+            int: The precomputed side sign
+        """
+        side_sign: int = self._side_sign
+        return side_sign
+
     @property
     def is_long(self) -> bool:
         """Check if position is long.
@@ -112,7 +137,7 @@ class Position(BaseModel):
         Returns:
             bool: True if long position
         """
-        return self.position_side == DerivativeSide.LONG
+        return self._side_sign > 0
 
     @property
     def is_short(self) -> bool:
@@ -121,7 +146,7 @@ class Position(BaseModel):
         Returns:
             bool: True if short position
         """
-        return self.position_side == DerivativeSide.SHORT
+        return self._side_sign < 0
 
     def distance_from_liquidation(self, price: Decimal) -> Decimal:
         """Calculate absolute distance from liquidation price.
@@ -132,10 +157,7 @@ class Position(BaseModel):
         Returns:
             Decimal: Distance from liquidation in quote currency
         """
-        distance = price - self.liquidation_price
-        if self.is_short:
-            distance = -distance
-        return distance
+        return (price - self.liquidation_price) * self._side_sign
 
     def percentage_from_liquidation(self, price: Decimal) -> Decimal:
         """Calculate percentage distance from liquidation price.
@@ -176,7 +198,7 @@ class Position(BaseModel):
         return distance / self.margin
 
     def is_at_liquidation_risk(
-        self, price: Decimal, max_percentage: Decimal = Decimal("95")
+        self, price: Decimal, max_percentage: Decimal = _DEFAULT_RISK_PERCENTAGE
     ) -> bool:
         """Check if position is at risk of liquidation.
 
@@ -187,6 +209,84 @@ class Position(BaseModel):
         Returns:
             bool: True if position is at risk of liquidation
         """
-        percentage = self.margin_percentage_from_liquidation(price) * Decimal("100")
-        risk = percentage <= max_percentage
-        return risk
+        # Compare remaining-margin fractions directly instead of scaling to
+        # percent on every check; the default threshold is precomputed.
+        if max_percentage is _DEFAULT_RISK_PERCENTAGE:
+            threshold = _DEFAULT_RISK_FRACTION
+        else:
+            threshold = max_percentage / s_decimal_100
+        remaining_fraction = (self.margin + self.unrealized_pnl) / self.margin
+        return remaining_fraction <= threshold
+
+
+class PositionBook:
+    """Structure-of-arrays view over a batch of positions.
+
+    Portfolio-wide risk scans over many Position objects pay per-instance
+    attribute lookups and Decimal arithmetic. This helper stores the numeric
+    fields as parallel float64 NumPy arrays so distance/risk calculations
+    over the whole book become single vectorized expressions.
+
+    Use Position for single-instance ergonomics and exact Decimal math;
+    route batch monitoring through a PositionBook.
+    """
+
+    def __init__(self, positions: list[Position]) -> None:
+        import numpy as np
+
+        self.positions = positions
+        self.amounts = np.array([float(p.amount) for p in positions])
+        self.entry_prices = np.array([float(p.entry_price) for p in positions])
+        self.margins = np.array([float(p.margin) for p in positions])
+        self.unrealized_pnls = np.array([float(p.unrealized_pnl) for p in positions])
+        self.liquidation_prices = np.array(
+            [float(p.liquidation_price) for p in positions]
+        )
+        self.side_signs = np.array([p.side_sign for p in positions], dtype=np.int8)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def distance_from_liquidation(self, prices: Any) -> Any:
+        """Vectorized signed distance from liquidation for the whole book.
+
+        Args:
+            prices: Array of current market prices, one per position
+
+        Returns:
+            np.ndarray: Signed distances in quote currency
+        """
+        return (prices - self.liquidation_prices) * self.side_signs
+
+    def percentage_from_liquidation(self, prices: Any) -> Any:
+        """Vectorized percentage distance from liquidation.
+
+        Positions with a zero liquidation price report infinity, matching
+        Position.percentage_from_liquidation.
+
+        Args:
+            prices: Array of current market prices, one per position
+
+        Returns:
+            np.ndarray: Fractional distances from liquidation
+        """
+        import numpy as np
+
+        with np.errstate(divide="ignore"):
+            return np.where(
+                self.liquidation_prices == 0.0,
+                np.inf,
+                self.distance_from_liquidation(prices) / self.liquidation_prices,
+            )
+
+    def is_at_liquidation_risk(self, max_fraction: float = 0.95) -> Any:
+        """Vectorized liquidation-risk mask for the whole book.
+
+        Args:
+            max_fraction: Maximum safe remaining-margin fraction
+
+        Returns:
+            np.ndarray: Boolean mask, True where a position is at risk
+        """
+        remaining_fraction = (self.margins + self.unrealized_pnls) / self.margins
+        return remaining_fraction <= max_fraction
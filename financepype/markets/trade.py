@@ -3,6 +3,7 @@ from decimal import Decimal
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from financepype.constants import s_decimal_0
 from financepype.markets.trading_pair import TradingPair
 from financepype.operations.orders.models import TradeType
 
@@ -36,8 +37,39 @@ class PublicTrade(BaseModel):
 
     @model_validator(mode="after")
     def validate_positive_values(self) -> "PublicTrade":
-        if self.price <= Decimal("0"):
+        if self.price <= s_decimal_0:
             raise ValueError("Price must be greater than zero")
-        if self.amount <= Decimal("0"):
+        if self.amount <= s_decimal_0:
             raise ValueError("Amount must be greater than zero")
         return self
+
+    @classmethod
+    def from_feed(
+        cls,
+        trade_id: str,
+        trading_pair: TradingPair,
+        price: Decimal,
+        amount: Decimal,
+        side: TradeType,
+        time: datetime,
+        is_liquidation: bool,
+    ) -> "PublicTrade":
+        """Build a trade from an already-sanitized feed payload.
+
+        This is the trusted-input fast path for high-volume trade feeds:
+        it skips pydantic validation via model_construct, so the caller is
+        responsible for passing well-typed, positive price/amount values.
+        Use the regular constructor for user or external input.
+
+        Returns:
+            PublicTrade: The constructed trade
+        """
+        return cls.model_construct(
+            trade_id=trade_id,
+            trading_pair=trading_pair,
+            price=price,
+            amount=amount,
+            side=side,
+            time=time,
+            is_liquidation=is_liquidation,
+        )
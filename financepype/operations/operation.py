@@ -1,4 +1,5 @@
 import asyncio
+import sys
 from abc import abstractmethod
 from typing import Any
 
@@ -50,7 +51,12 @@ class Operation(BaseModel):
     def model_post_init(self, __context: Any) -> None:
         """Initialize non-Pydantic attributes after model initialization."""
         super().model_post_init(__context)
+        # Interned ids make the equality guards in the update hot paths
+        # pointer comparisons in the common case.
+        self.client_operation_id = sys.intern(self.client_operation_id)
         if self.operator_operation_id:
+            if isinstance(self.operator_operation_id, str):
+                self.operator_operation_id = sys.intern(self.operator_operation_id)
             self.operator_operation_id_update_event.set()
 
     def __str__(self) -> str:
@@ -85,6 +91,8 @@ class Operation(BaseModel):
             raise ValueError(
                 f"Cannot update operator operation id from {self.operator_operation_id} to {operator_operation_id}"
             )
+        if isinstance(operator_operation_id, str):
+            operator_operation_id = sys.intern(operator_operation_id)
         self.operator_operation_id = operator_operation_id
         self.operator_operation_id_update_event.set()
 
@@ -1,8 +1,9 @@
 from decimal import Decimal
 from enum import Enum
+from functools import cached_property
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from financepype.assets.contract import DerivativeSide
 from financepype.markets.trading_pair import TradingPair
@@ -58,20 +59,26 @@ class TradeType(Enum):
     RANGE = "RANGE"
 
     def opposite(self) -> "TradeType":
-        if self == TradeType.BUY:
-            return TradeType.SELL
-        elif self == TradeType.SELL:
-            return TradeType.BUY
-        else:
-            raise ValueError("TradeType.RANGE does not have an opposite.")
+        try:
+            return _OPPOSITE_TRADE_TYPE[self]
+        except KeyError:
+            raise ValueError("TradeType.RANGE does not have an opposite.") from None
 
     def to_position_side(self) -> DerivativeSide:
-        if self == TradeType.BUY:
-            return DerivativeSide.LONG
-        elif self == TradeType.SELL:
-            return DerivativeSide.SHORT
-        else:
-            return DerivativeSide.BOTH
+        return _TRADE_TYPE_POSITION_SIDE[self]
+
+
+# Precomputed lookups so the per-fill conversions are single dict hits
+# instead of comparison chains.
+_OPPOSITE_TRADE_TYPE = {
+    TradeType.BUY: TradeType.SELL,
+    TradeType.SELL: TradeType.BUY,
+}
+_TRADE_TYPE_POSITION_SIDE = {
+    TradeType.BUY: DerivativeSide.LONG,
+    TradeType.SELL: DerivativeSide.SHORT,
+    TradeType.RANGE: DerivativeSide.BOTH,
+}
 
 
 class OrderState(Enum):
@@ -89,8 +96,13 @@ class OrderUpdate(BaseModel):
 
     This class contains information about changes to an order's state,
     including new state, timestamps, and identifiers.
+
+    Updates are produced by exchange parsers and consumed once, so they
+    are frozen: no accidental mutation and no per-assignment validation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     trading_pair: TradingPair
     update_timestamp: float  # seconds
     new_state: OrderState
@@ -104,8 +116,13 @@ class TradeUpdate(BaseModel):
 
     This class contains information about a trade that has occurred,
     including fill details, prices, amounts, and fees.
+
+    Like OrderUpdate, trade updates are single-use value objects and are
+    frozen.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     trade_id: str
     client_order_id: str | None = None
     exchange_order_id: str
@@ -118,7 +135,7 @@ class TradeUpdate(BaseModel):
     fee: OperationFee
     group_order_id: str = ""
 
-    @property
+    @cached_property
     def group_client_order_id(self) -> str | None:
         return (
             f"{self.group_order_id}{self.client_order_id}"
@@ -1,5 +1,6 @@
 import asyncio
 from decimal import Decimal
+from functools import cached_property
 from typing import Any
 from warnings import deprecated
 
@@ -18,6 +19,24 @@ from financepype.operations.orders.models import (
     TradeUpdate,
 )
 
+# Remaining-amount tolerance below which an order counts as fully filled.
+# Compared directly instead of quantizing, which would allocate a new
+# Decimal on every fill event.
+_FILL_TOLERANCE = s_decimal_1e_8
+
+# State sets hoisted to module scope so status polls do not rebuild a set
+# per property access.
+_OPEN_STATES = frozenset(
+    {OrderState.PENDING_CREATE, OrderState.OPEN, OrderState.PENDING_CANCEL}
+)
+_DONE_STATES = frozenset({OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED})
+
+# Uppercase display names, precomputed so burst order placement does not
+# allocate a new string per .name.upper() call.
+_ORDER_TYPE_UPPER = {member: member.name.upper() for member in OrderType}
+_TRADE_TYPE_UPPER = {member: member.name.upper() for member in TradeType}
+_POSITION_UPPER = {member: member.name.upper() for member in PositionAction}
+
 
 class OrderOperation(Operation):
     """A class representing a trading order operation.
@@ -41,11 +60,23 @@ class OrderOperation(Operation):
     order_fills: dict[str, TradeUpdate] = Field(default_factory=dict)
     current_state: OrderState = Field(default=OrderState.PENDING_CREATE)
 
-    completely_filled_event: asyncio.Event = Field(
-        default_factory=asyncio.Event,
+    # Allocated lazily: most orders are never awaited, so the Event (and its
+    # internal deque) would be pure waste. See _get_or_create_filled_event.
+    completely_filled_event: asyncio.Event | None = Field(
+        default=None,
         exclude=True,
     )
 
+    # Running fill aggregates, maintained in _update_with_trade_update so
+    # average_executed_price is O(1) instead of re-scanning every fill.
+    _executed_value_sum: Decimal = s_decimal_0
+    _filled_base_sum: Decimal = s_decimal_0
+    # Float mirrors of the aggregates for the approximate analytics path.
+    _executed_value_f64: float = 0.0
+    _filled_base_f64: float = 0.0
+    # Sticky flag so an event created after the fill still starts set.
+    _completely_filled: bool = False
+
     def model_post_init(self, __context: Any) -> None:
         """Initialize non-Pydantic attributes after model initialization."""
         super().model_post_init(__context)
@@ -56,6 +87,14 @@ class OrderOperation(Operation):
         if self.index_price is None:
             self.index_price = self.price
 
+        for order_fill in self.order_fills.values():
+            self._executed_value_sum += (
+                order_fill.fill_price * order_fill.fill_base_amount
+            )
+            self._filled_base_sum += order_fill.fill_base_amount
+        self._executed_value_f64 = float(self._executed_value_sum)
+        self._filled_base_f64 = float(self._filled_base_sum)
+
     # === Properties ===
 
     @property
@@ -75,8 +114,10 @@ class OrderOperation(Operation):
     def exchange_order_id_update_event(self) -> asyncio.Event:
         return self.operator_operation_id_update_event
 
-    @property
+    @cached_property
     def group_client_order_id(self) -> str:
+        # group_order_id and client_operation_id are fixed for the lifetime
+        # of the order, so the concatenation is computed once.
         return f"{self.group_order_id}{self.client_operation_id}"
 
     @property
@@ -109,15 +150,24 @@ class OrderOperation(Operation):
 
     @property
     def average_executed_price(self) -> Decimal | None:
-        executed_value: Decimal = s_decimal_0
-        total_base_amount: Decimal = s_decimal_0
-        for order_fill in self.order_fills.values():
-            executed_value += order_fill.fill_price * order_fill.fill_base_amount
-            total_base_amount += order_fill.fill_base_amount
+        executed_value = self._executed_value_sum
+        total_base_amount = self._filled_base_sum
         if executed_value == s_decimal_0 or total_base_amount == s_decimal_0:
             return None
         return executed_value / total_base_amount
 
+    @property
+    def approx_average_executed_price(self) -> float | None:
+        """Float approximation of average_executed_price.
+
+        Intended for display/analytics paths where float64 precision is
+        acceptable; settlement-grade code should use the exact Decimal
+        property instead.
+        """
+        if self._executed_value_f64 == 0.0 or self._filled_base_f64 == 0.0:
+            return None
+        return self._executed_value_f64 / self._filled_base_f64
+
     # === Status Properties ===
 
     @property
@@ -130,25 +180,15 @@ class OrderOperation(Operation):
 
     @property
     def is_open(self) -> bool:
-        return self.current_state in {
-            OrderState.PENDING_CREATE,
-            OrderState.OPEN,
-            OrderState.PENDING_CANCEL,
-        }
+        return self.current_state in _OPEN_STATES
 
     def _is_fully_executed(self) -> bool:
         """Check if the order is fully executed using Decimal arithmetic."""
-        return (self.amount - self.executed_amount_base).quantize(
-            s_decimal_1e_8
-        ) <= s_decimal_0
+        return self.executed_amount_base + _FILL_TOLERANCE >= self.amount
 
     @property
     def is_done(self) -> bool:
-        return (
-            self.current_state
-            in {OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED}
-            or self._is_fully_executed()
-        )
+        return self.current_state in _DONE_STATES or self._is_fully_executed()
 
     @property
     def is_filled(self) -> bool:
@@ -174,6 +214,22 @@ class OrderOperation(Operation):
             return self._update_with_trade_update(update)
         return False
 
+    def apply_order_update(self, order_update: OrderUpdate) -> bool:
+        """Typed fast path for order updates.
+
+        Callers that already know the update type (e.g. exchange adapters
+        that parsed the payload) can skip the isinstance dispatch of
+        process_operation_update.
+        """
+        return self._update_with_order_update(order_update)
+
+    def apply_trade_update(self, trade_update: TradeUpdate) -> bool:
+        """Typed fast path for trade updates.
+
+        See apply_order_update.
+        """
+        return self._update_with_trade_update(trade_update)
+
     def _update_with_order_update(self, order_update: OrderUpdate) -> bool:
         """Update the in flight order with an order update (from REST API or WS API)."""
         if order_update.client_order_id != self.client_operation_id or (
@@ -237,6 +293,15 @@ class OrderOperation(Operation):
 
         self.order_fills[trade_id] = trade_update
 
+        # Fills are append-only (guarded by the trade_id early-return above),
+        # so the running aggregates never need invalidation.
+        self._executed_value_sum += (
+            trade_update.fill_price * trade_update.fill_base_amount
+        )
+        self._filled_base_sum += trade_update.fill_base_amount
+        self._executed_value_f64 = float(self._executed_value_sum)
+        self._filled_base_f64 = float(self._filled_base_sum)
+
         self.executed_amount_base += trade_update.fill_base_amount
         self.executed_amount_quote += trade_update.fill_quote_amount
 
@@ -263,31 +328,44 @@ class OrderOperation(Operation):
         return self.process_operation_update(trade_update)
 
     def check_filled_condition(self) -> None:
-        if (self.amount - self.executed_amount_base).quantize(
-            s_decimal_1e_8
-        ) <= s_decimal_0:
-            self.completely_filled_event.set()
+        if self._is_fully_executed():
+            self._completely_filled = True
+            if self.completely_filled_event is not None:
+                self.completely_filled_event.set()
+
+    def _get_or_create_filled_event(self) -> asyncio.Event:
+        """Get the completely-filled event, allocating it on first use."""
+        event = self.completely_filled_event
+        if event is None:
+            event = asyncio.Event()
+            if self._completely_filled:
+                event.set()
+            self.completely_filled_event = event
+        return event
 
     async def wait_until_completely_filled(self) -> None:
-        await self.completely_filled_event.wait()
+        await self._get_or_create_filled_event().wait()
 
     # === Other ===
 
     async def get_exchange_order_id(self, timeout: float = 10) -> str | None:
         if self.operator_operation_id is None:
-            async with asyncio.timeout(timeout):
-                await self.operator_operation_id_update_event.wait()
+            await asyncio.wait_for(
+                self.operator_operation_id_update_event.wait(), timeout=timeout
+            )
         return self.operator_operation_id
 
     def build_order_created_message(self) -> str:
+        order_type = _ORDER_TYPE_UPPER[self.order_type]
+        trade_type = _TRADE_TYPE_UPPER[self.trade_type]
         if self.trading_pair.market_info.market_type.is_spot:
             message = (
-                f"Created {self.order_type.name.upper()} {self.trade_type.name.upper()} order "
+                f"Created {order_type} {trade_type} order "
                 f"{self.client_operation_id} for {self.amount} {self.trading_pair}."
             )
         else:
             message = (
-                f"Created {self.order_type.name.upper()} {self.trade_type.name.upper()} order "
-                f"{self.client_operation_id} for {self.amount} to {self.position.name.upper()} a {self.trading_pair} position."
+                f"Created {order_type} {trade_type} order "
+                f"{self.client_operation_id} for {self.amount} to {_POSITION_UPPER[self.position]} a {self.trading_pair} position."
             )
         return message
@@ -104,7 +104,7 @@ class OrderTracker(OperationTracker):
 
             previous_state: OrderState = tracked_order.current_state
 
-            updated: bool = tracked_order.process_operation_update(order_update)
+            updated: bool = tracked_order.apply_order_update(order_update)
             if updated:
                 self._trigger_order_creation(
                     tracked_order,
@@ -176,7 +176,7 @@ class OrderTracker(OperationTracker):
 
         previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
-        updated: bool = tracked_order.process_operation_update(trade_update)
+        updated: bool = tracked_order.apply_trade_update(trade_update)
         if updated:
             self._trigger_order_fills(
                 tracked_order=tracked_order,
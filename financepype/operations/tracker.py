@@ -1,5 +1,7 @@
 import logging
-from collections import defaultdict
+from collections import ChainMap, defaultdict
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from cachetools import TTLCache
@@ -61,13 +63,24 @@ class OperationTracker:
         super().__init__()
 
         self._event_publishers = event_publishers
+        # Bound publish methods, resolved once instead of per event.
+        self._publish_methods = tuple(
+            publisher.publish for publisher in event_publishers
+        )
         self._lost_operation_count_limit = lost_operation_count_limit
         self._in_flight_operations: dict[str, Operation] = {}
         self._cached_operations: TTLCache[str, Operation] = TTLCache(
             maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_OPERATION_TTL
         )
         self._lost_operations: dict[str, Operation] = {}
-        self._operation_not_found_records: dict[str, int] = defaultdict(lambda: 0)
+        self._operation_not_found_records: dict[str, int] = defaultdict(int)
+        # Secondary index mapping operator operation ids to client operation
+        # ids, so operator-id lookups avoid a linear scan. The TTL mirror
+        # tracks operations that moved to the cache.
+        self._operator_id_index: dict[Any, str] = {}
+        self._cached_id_index: TTLCache[Any, str] = TTLCache(
+            maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_OPERATION_TTL
+        )
 
     # === Properties ===
 
@@ -81,44 +94,53 @@ class OperationTracker:
         return self._in_flight_operations
 
     @property
-    def cached_operations(self) -> dict[str, Operation]:
+    def cached_operations(self) -> Mapping[str, Operation]:
         """Get recently completed operations from cache.
 
+        Returns a read-only view rather than a snapshot copy; entries may
+        disappear from the view as their TTL expires.
+
         Returns:
-            dict[str, Operation]: Map of client IDs to cached operations
+            Mapping[str, Operation]: Map of client IDs to cached operations
         """
-        return dict(self._cached_operations.items())
+        return MappingProxyType(self._cached_operations)
 
     @property
-    def lost_operations(self) -> dict[str, Operation]:
+    def lost_operations(self) -> Mapping[str, Operation]:
         """Get operations marked as lost or failed.
 
+        Returns a read-only view rather than a snapshot copy.
+
         Returns:
-            dict[str, Operation]: Map of client IDs to lost operations
+            Mapping[str, Operation]: Map of client IDs to lost operations
         """
-        return dict(self._lost_operations.items())
+        return MappingProxyType(self._lost_operations)
 
     @property
-    def all_updatable_operations(self) -> dict[str, Operation]:
+    def all_updatable_operations(self) -> Mapping[str, Operation]:
         """Get all operations that can still receive updates.
 
+        Returns a live ChainMap view over the underlying maps instead of
+        copying them on every access.
+
         Returns:
-            dict[str, Operation]: Map of client IDs to updatable operations
+            Mapping[str, Operation]: Map of client IDs to updatable operations
         """
-        return {**self.active_operations, **self.lost_operations}
+        return ChainMap(self._lost_operations, self._in_flight_operations)
 
     @property
-    def all_operations(self) -> dict[str, Operation]:
+    def all_operations(self) -> Mapping[str, Operation]:
         """Get all tracked operations across all states.
 
+        Returns a live ChainMap view over the underlying maps instead of
+        copying them on every access.
+
         Returns:
-            dict[str, Operation]: Map of client IDs to all operations
+            Mapping[str, Operation]: Map of client IDs to all operations
         """
-        return {
-            **self.active_operations,
-            **self.cached_operations,
-            **self.lost_operations,
-        }
+        return ChainMap(
+            self._lost_operations, self._cached_operations, self._in_flight_operations
+        )
 
     # === Tracking ===
 
@@ -129,6 +151,10 @@ class OperationTracker:
             operation (Operation): The operation to track
         """
         self._in_flight_operations[operation.client_operation_id] = operation
+        if operation.operator_operation_id is not None:
+            self._operator_id_index[operation.operator_operation_id] = (
+                operation.client_operation_id
+            )
 
     def stop_tracking_operation(self, client_operation_id: str) -> None:
         """Stop tracking an operation and move it to cache.
@@ -137,10 +163,14 @@ class OperationTracker:
             client_operation_id (str): ID of the operation to stop tracking
         """
         if client_operation_id in self._in_flight_operations:
-            self._cached_operations[client_operation_id] = self._in_flight_operations[
-                client_operation_id
-            ]
+            operation = self._in_flight_operations[client_operation_id]
+            self._cached_operations[client_operation_id] = operation
             del self._in_flight_operations[client_operation_id]
+            if operation.operator_operation_id is not None:
+                self._operator_id_index.pop(operation.operator_operation_id, None)
+                self._cached_id_index[operation.operator_operation_id] = (
+                    client_operation_id
+                )
 
     def restore_tracking_states(self, tracking_states: dict[str, Any]) -> None:
         """Restore tracker state from saved state.
@@ -159,14 +189,14 @@ class OperationTracker:
         self,
         client_operation_id: str | None = None,
         operator_operation_id: Any | None = None,
-        operations: dict[str, Operation] | None = None,
+        operations: Mapping[str, Operation] | None = None,
     ) -> Operation | None:
         """Fetch an operation by its client or operator ID.
 
         Args:
             client_operation_id (str | None): Client-assigned operation ID
             operator_operation_id (Any | None): Operator-assigned operation ID
-            operations (dict[str, Operation] | None): Operations to search in
+            operations (Mapping[str, Operation] | None): Operations to search in
 
         Returns:
             Operation | None: The found operation or None
@@ -185,14 +215,30 @@ class OperationTracker:
         if client_operation_id is not None:
             found_order = operations.get(client_operation_id, None)
         else:
-            found_order = next(
-                (
-                    operation
-                    for operation in operations.values()
-                    if operation.operator_operation_id == operator_operation_id
-                ),
-                None,
-            )
+            # Try the secondary index first: two O(1) lookups instead of a
+            # linear scan over every tracked operation.
+            indexed_client_id = self._operator_id_index.get(operator_operation_id)
+            if indexed_client_id is None:
+                indexed_client_id = self._cached_id_index.get(operator_operation_id)
+            found_order = None
+            if indexed_client_id is not None:
+                candidate = operations.get(indexed_client_id, None)
+                if (
+                    candidate is not None
+                    and candidate.operator_operation_id == operator_operation_id
+                ):
+                    found_order = candidate
+            if found_order is None:
+                # Operator ids assigned directly on the operation never reach
+                # the index, so keep the scan as a fallback.
+                found_order = next(
+                    (
+                        operation
+                        for operation in operations.values()
+                        if operation.operator_operation_id == operator_operation_id
+                    ),
+                    None,
+                )
 
         return found_order
 
@@ -273,6 +319,7 @@ class OperationTracker:
         operation = self.fetch_tracked_operation(client_operation_id)
         if operation:
             operation.update_operator_operation_id(operator_operation_id)
+            self._operator_id_index[operator_operation_id] = client_operation_id
         return operation
 
     # === Events ===
@@ -284,5 +331,5 @@ class OperationTracker:
             event_publication (EventPublication): The event publication details
             event (Any): The event data to publish
         """
-        for event_publisher in self._event_publishers:
-            event_publisher.publish(event_publication, event)
+        for publish in self._publish_methods:
+            publish(event_publication, event)
@@ -25,7 +25,7 @@ class BlockchainTransactionEvent(Enum):
     TransactionCancelled = 906
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionEvent:
     """
     Base class for all transaction events.
@@ -39,42 +39,42 @@ class TransactionEvent:
     client_operation_id: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionBroadcastedEvent(TransactionEvent):
     """Event emitted when a transaction is successfully broadcast to the blockchain network."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionConfirmedEvent(TransactionEvent):
     """Event emitted when a transaction is confirmed in a block on the blockchain."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionFinalizedEvent(TransactionEvent):
     """Event emitted when a transaction has received enough confirmations to be considered final."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionFailedEvent(TransactionEvent):
     """Event emitted when a transaction execution fails on the blockchain."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionRejectedEvent(TransactionEvent):
     """Event emitted when a transaction is rejected by the blockchain network."""
 
     pass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TransactionCancelledEvent(TransactionEvent):
     """Event emitted when a transaction is cancelled by the user before execution."""
 
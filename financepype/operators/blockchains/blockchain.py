@@ -9,19 +9,35 @@ from financepype.platforms.blockchain import BlockchainPlatform, BlockchainType
 
 
 class Blockchain(Operator):
+    __slots__ = ("_platform", "_name", "_type")
+
+    def __init__(self, configuration: BlockchainConfiguration):
+        super().__init__(configuration)
+
+        # The platform is fixed for the operator's lifetime, so the
+        # property chains (configuration -> platform -> type/name) are
+        # resolved once here instead of on every access.
+        self._platform = configuration.platform
+        self._name = str(self._platform)
+        self._type = self._platform.type
+
     # === Properties ===
 
     @property
     def platform(self) -> BlockchainPlatform:
-        return cast(BlockchainPlatform, super().platform)
+        return self._platform
 
     @property
     def configuration(self) -> BlockchainConfiguration:
         return cast(BlockchainConfiguration, super().configuration)
 
+    @property
+    def name(self) -> str:
+        return self._name
+
     @property
     def type(self) -> BlockchainType:
-        return self.platform.type
+        return self._type
 
     # === Transactions ===
 
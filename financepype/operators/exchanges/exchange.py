@@ -1,9 +1,10 @@
 import asyncio
+import contextvars
+import math
 from abc import abstractmethod
-from decimal import Decimal
-from hashlib import md5
-
-from bidict import bidict
+from collections.abc import Callable, Mapping
+from decimal import ROUND_DOWN, Decimal
+from hashlib import shake_128
 
 from financepype.constants import s_decimal_0, s_decimal_min, s_decimal_NaN
 from financepype.markets.trading_pair import TradingPair
@@ -19,7 +20,10 @@ from financepype.operators.operator import Operator, OperatorConfiguration
 from financepype.owners.owner import Owner
 from financepype.platforms.platform import Platform
 from financepype.rules.trading_rule import TradingRule
-from financepype.rules.trading_rules_tracker import TradingRulesTracker
+from financepype.rules.trading_rules_tracker import (
+    NullTradingRulesTracker,
+    TradingRulesTracker,
+)
 from financepype.simulations.balances.engines.models import OrderDetails
 
 
@@ -27,6 +31,35 @@ class ExchangeConfiguration(OperatorConfiguration):
     platform: Platform
 
 
+# Powers of ten used for price quantums, built once so the quantization
+# path never parses a Decimal from a string.
+_POW10_DECIMALS = {k: Decimal(10) ** k for k in range(-30, 31)}
+
+
+def _floor_to_quantum(value: Decimal, quantum: Decimal) -> Decimal:
+    """Round value down to a multiple of quantum.
+
+    Power-of-ten quantums use Decimal.quantize — a single digit shift —
+    instead of a floor division plus multiplication. quantize only
+    honors the quantum's exponent, so any other increment (e.g. 0.05)
+    must keep the two-operation form.
+    """
+    if quantum.as_tuple().digits == (1,):
+        return value.quantize(quantum, rounding=ROUND_DOWN)
+    return (value // quantum) * quantum
+
+
+def _float_floor_to_quantum(value: Decimal, quantum: Decimal) -> Decimal:
+    """Float fast path for _floor_to_quantum.
+
+    Roughly an order of magnitude cheaper than Decimal arithmetic, but
+    subject to IEEE-754 rounding: only used for rules that opted in via
+    TradingRule.use_float_quantize.
+    """
+    quantum_f = float(quantum)
+    return Decimal(repr(math.floor(float(value) / quantum_f) * quantum_f))
+
+
 class Exchange(Operator):
     """Base class for cryptocurrency exchange operators.
 
@@ -50,6 +83,17 @@ class Exchange(Operator):
         >>> order_id = exchange.place_order(account, order_details)
     """
 
+    __slots__ = (
+        "_trading_pairs",
+        "_trading_pairs_set",
+        "_trading_pairs_snapshot",
+        "_trading_rules_tracker",
+        "_price_quantum_cache",
+        "_size_quantum_cache",
+        "_order_id_prefix_cache",
+        "_order_update_handlers",
+    )
+
     def __init__(self, configuration: ExchangeConfiguration):
         """Initialize a new exchange operator.
 
@@ -59,9 +103,33 @@ class Exchange(Operator):
         super().__init__(configuration)
 
         self._trading_pairs: list[str] = []
-        self._trading_rules_tracker: TradingRulesTracker | None = None
+        self._trading_pairs_set: frozenset[str] = frozenset()
+        self._trading_pairs_snapshot: tuple[str, ...] = ()
+        # Null object until init_trading_rules_tracker installs the real
+        # tracker, so delegating methods need no None guards.
+        self._trading_rules_tracker: TradingRulesTracker = NullTradingRulesTracker()
         # self._order_tracker: OrderTracker = ...
 
+        # Quantum memo caches for the order quantization hot path. Entries
+        # store the TradingRule they were computed from and are bypassed
+        # when the tracker swaps in a new rule object, so no explicit
+        # invalidation hook is needed.
+        self._price_quantum_cache: dict[
+            tuple[TradingPair, int], tuple[TradingRule, Decimal]
+        ] = {}
+        self._size_quantum_cache: dict[TradingPair, tuple[TradingRule, Decimal]] = {}
+
+        # Assembled client-order-id prefixes, keyed by (prefix, is_buy,
+        # trading pair). The key space is bounded by the traded markets, so
+        # the per-order string slicing and concatenation happen once per key.
+        self._order_id_prefix_cache: dict[tuple[str, bool, TradingPair], str] = {}
+
+        # Optional per-state handlers for process_order_update implementors;
+        # see register_order_update_handler.
+        self._order_update_handlers: dict[
+            OrderState, Callable[[Owner, OrderUpdate], None]
+        ] = {}
+
         self.init_trading_rules_tracker()
 
     # === Properties ===
@@ -73,16 +141,14 @@ class Exchange(Operator):
         Returns:
             dict[str, TradingRule]: Map of trading pairs to their rules
         """
-        if self.trading_rules_tracker is None:
-            return {}
         return self.trading_rules_tracker.trading_rules
 
     @property
-    def trading_rules_tracker(self) -> TradingRulesTracker | None:
+    def trading_rules_tracker(self) -> TradingRulesTracker:
         """Get the trading rules tracker.
 
         Returns:
-            TradingRulesTracker | None: The rules tracker instance
+            TradingRulesTracker: The rules tracker instance
         """
         return self._trading_rules_tracker
 
@@ -95,6 +161,20 @@ class Exchange(Operator):
         """
         return self._trading_pairs
 
+    @trading_pairs.setter
+    def trading_pairs(self, trading_pairs: list[str]) -> None:
+        """Set supported trading pairs.
+
+        Keeps the membership set in sync with the list so validity checks
+        stay O(1).
+
+        Args:
+            trading_pairs (list[str]): List of supported trading pair symbols
+        """
+        self._trading_pairs = list(trading_pairs)
+        self._trading_pairs_set = frozenset(trading_pairs)
+        self._trading_pairs_snapshot = tuple(trading_pairs)
+
     @property
     @abstractmethod
     def supported_order_types(self) -> list[OrderType]:
@@ -156,59 +236,55 @@ class Exchange(Operator):
     def get_valid_trading_pairs(
         self, trading_pairs: str | list[str] | None = None
     ) -> list[str]:
-        valid_trading_pairs = self.trading_pairs
-
-        if trading_pairs is None:
-            trading_pairs = []
+        if trading_pairs is None or len(trading_pairs) == 0:
+            return self._trading_pairs
         if isinstance(trading_pairs, str):
-            trading_pairs = [trading_pairs]
-        if len(trading_pairs) > 0:
-            valid_trading_pairs = [
-                trading_pair
-                for trading_pair in trading_pairs
-                if trading_pair in valid_trading_pairs
-            ]
-        return valid_trading_pairs
-
-    async def trading_pair_symbol_map(self) -> bidict[TradingPair, str]:
-        if self.trading_rules_tracker is None:
-            return bidict()
+            # Single-pair fast path: one membership probe, no intermediate
+            # list or comprehension.
+            if trading_pairs in self._valid_pairs_set():
+                return [trading_pairs]
+            return []
+        valid_set = self._valid_pairs_set()
+        return [
+            trading_pair for trading_pair in trading_pairs if trading_pair in valid_set
+        ]
+
+    def _valid_pairs_set(self) -> frozenset[str]:
+        # The trading_pairs getter hands out the internal list, so it can be
+        # mutated in place without going through the setter. Comparing
+        # against a tuple snapshot catches any change (including same-length
+        # replacements); the comparison is pointer-cheap for unchanged lists.
+        current = tuple(self._trading_pairs)
+        if current != self._trading_pairs_snapshot:
+            self._trading_pairs_set = frozenset(current)
+            self._trading_pairs_snapshot = current
+        return self._trading_pairs_set
+
+    async def trading_pair_symbol_map(self) -> Mapping[TradingPair, str]:
         return await self.trading_rules_tracker.trading_pair_symbol_map()
 
     def trading_pair_symbol_map_ready(self) -> bool:
-        if self.trading_rules_tracker is None:
-            return False
         return self.trading_rules_tracker.is_ready
 
-    async def all_trading_pairs(self) -> list[TradingPair]:
-        if self.trading_rules_tracker is None:
-            return []
+    async def all_trading_pairs(self) -> tuple[TradingPair, ...]:
         return await self.trading_rules_tracker.all_trading_pairs()
 
-    async def all_exchange_symbols(self) -> list[str]:
-        if self.trading_rules_tracker is None:
-            return []
+    async def all_exchange_symbols(self) -> tuple[str, ...]:
         return await self.trading_rules_tracker.all_exchange_symbols()
 
     async def exchange_symbol_associated_to_pair(
         self, trading_pair: TradingPair
     ) -> str:
-        if self.trading_rules_tracker is None:
-            return trading_pair.name
         return await self.trading_rules_tracker.exchange_symbol_associated_to_pair(
             trading_pair
         )
 
     async def is_trading_pair_valid(self, trading_pair: TradingPair) -> bool:
-        if self.trading_rules_tracker is None:
-            return False
         return await self.trading_rules_tracker.is_trading_pair_valid(trading_pair)
 
     async def trading_pair_associated_to_exchange_symbol(
         self, symbol: str
     ) -> TradingPair:
-        if self.trading_rules_tracker is None:
-            raise ValueError("Trading rules tracker is not initialized")
         return (
             await self.trading_rules_tracker.trading_pair_associated_to_exchange_symbol(
                 symbol
@@ -216,10 +292,31 @@ class Exchange(Operator):
         )
 
     async def is_exchange_symbol_valid(self, symbol: str) -> bool:
-        if self.trading_rules_tracker is None:
-            return False
         return await self.trading_rules_tracker.is_exchange_symbol_valid(symbol)
 
+    # Sync variants for hot paths where the symbol map is already
+    # populated: no coroutine allocation, no event-loop trampoline.
+
+    def exchange_symbol_associated_to_pair_sync(self, trading_pair: TradingPair) -> str:
+        return self.trading_rules_tracker.exchange_symbol_associated_to_pair_sync(
+            trading_pair
+        )
+
+    def trading_pair_associated_to_exchange_symbol_sync(
+        self, symbol: str
+    ) -> TradingPair:
+        return (
+            self.trading_rules_tracker.trading_pair_associated_to_exchange_symbol_sync(
+                symbol
+            )
+        )
+
+    def is_trading_pair_valid_sync(self, trading_pair: TradingPair) -> bool:
+        return self.trading_rules_tracker.is_trading_pair_valid_sync(trading_pair)
+
+    def is_exchange_symbol_valid_sync(self, symbol: str) -> bool:
+        return self.trading_rules_tracker.is_exchange_symbol_valid_sync(symbol)
+
     # === Price/Size Functions ===
 
     @abstractmethod
@@ -249,18 +346,23 @@ class Exchange(Operator):
         if min_price_significance:
             if price == s_decimal_0:
                 price = self.get_price(trading_pair, True)
-            integer_number = int(price)
-            if integer_number == s_decimal_0:
-                str_price_decimals = f"{price:f}".split(".")[1]
-                int_price_decimals = int(str_price_decimals)
-                leading_zeros = len(str_price_decimals) - len(str(int_price_decimals))
-                price_quantum_significance = Decimal(
-                    str(10 ** (-leading_zeros - min_price_significance))
-                )
+            # Decimal.as_tuple gives the digit count and exponent as O(1)
+            # field reads; integer digits and leading zeros collapse into a
+            # single expression (negative values count leading zeros).
+            price_tuple = price.as_tuple()
+            integer_digits = len(price_tuple.digits) + int(price_tuple.exponent)
+            exponent = integer_digits - min_price_significance
+            cache_key = (trading_pair, exponent)
+            cached = self._price_quantum_cache.get(cache_key)
+            if cached is not None and cached[0] is trading_rule:
+                price_quantum_significance = cached[1]
             else:
-                integer_digits = len(str(integer_number))
-                price_quantum_significance = Decimal(
-                    str(10 ** (integer_digits - min_price_significance))
+                price_quantum_significance = (
+                    _POW10_DECIMALS.get(exponent) or Decimal(10) ** exponent
+                )
+                self._price_quantum_cache[cache_key] = (
+                    trading_rule,
+                    price_quantum_significance,
                 )
         else:
             price_quantum_significance = s_decimal_min
@@ -270,13 +372,28 @@ class Exchange(Operator):
         self, trading_pair: TradingPair, order_size: Decimal = s_decimal_0
     ) -> Decimal:
         trading_rule = self.trading_rules[trading_pair]
-        return Decimal(trading_rule.min_base_amount_increment)
+        return self._size_quantum_for_rule(trading_pair, trading_rule)
+
+    def _size_quantum_for_rule(
+        self, trading_pair: TradingPair, trading_rule: TradingRule
+    ) -> Decimal:
+        """Size quantum for an already-resolved rule, skipping the re-lookup."""
+        cached = self._size_quantum_cache.get(trading_pair)
+        if cached is not None and cached[0] is trading_rule:
+            return cached[1]
+        quantum = Decimal(trading_rule.min_base_amount_increment)
+        self._size_quantum_cache[trading_pair] = (trading_rule, quantum)
+        return quantum
 
     def quantize_order_amount(
         self, trading_pair: TradingPair, amount: Decimal, price: Decimal = s_decimal_0
     ) -> Decimal:
         trading_rule = self.trading_rules[trading_pair]
-        quantized_amount = self._quantize_order_amount(trading_pair, amount)
+        size_quantum = self._size_quantum_for_rule(trading_pair, trading_rule)
+        if trading_rule.use_float_quantize:
+            quantized_amount = _float_floor_to_quantum(amount, size_quantum)
+        else:
+            quantized_amount = _floor_to_quantum(amount, size_quantum)
 
         # Check against min_order_size and min_notional_size. If not passing either check, return 0.
         if quantized_amount < trading_rule.min_order_size:
@@ -287,7 +404,7 @@ class Exchange(Operator):
         notional_size = price * quantized_amount
 
         # Add 1% as a safety factor in case the prices changed while making the order.
-        if notional_size < trading_rule.min_notional_size * Decimal("1.01"):
+        if notional_size < trading_rule.min_notional_size_with_safety:
             return s_decimal_0
 
         return quantized_amount
@@ -296,15 +413,27 @@ class Exchange(Operator):
         self, trading_pair: TradingPair, amount: Decimal
     ) -> Decimal:
         order_size_quantum = self.get_order_size_quantum(trading_pair, amount)
-        return (amount // order_size_quantum) * order_size_quantum
+        return _floor_to_quantum(amount, order_size_quantum)
 
     def _quantize_order_price(
         self, trading_pair: TradingPair, price: Decimal
     ) -> Decimal:
-        if price.is_nan():
+        # NaN is the only Decimal that compares unequal to itself; this is
+        # a C-level comparison versus the is_nan() method dispatch.
+        if price != price:
             return price
+        return self._quantize_order_price_nonan(trading_pair, price)
+
+    def _quantize_order_price_nonan(
+        self, trading_pair: TradingPair, price: Decimal
+    ) -> Decimal:
+        """Quantize a price that is known not to be NaN.
+
+        Callers holding a price from get_price/get_order_price can use this
+        to skip the NaN guard entirely.
+        """
         price_quantum = self.get_order_price_quantum(trading_pair, price)
-        return (price // price_quantum) * price_quantum
+        return _floor_to_quantum(price, price_quantum)
 
     def quantize_order_price(
         self,
@@ -336,23 +465,32 @@ class Exchange(Operator):
         client_operation_id_prefix: str = "",
         max_id_len: int | None = None,
     ) -> str:
-        base = order_details.trading_pair.base
-        quote = order_details.trading_pair.quote
+        trading_pair = order_details.trading_pair
         is_buy = order_details.trade_type == TradeType.BUY
 
-        side = "B" if is_buy else "S"  # 1 char
-        base_str = f"{base[0]}{base[-1]}"  # 2 chars
-        quote_str = f"{quote[0]}{quote[-1]}"  # 2 chars
-        ts_hex = hex(self._microseconds_nonce_provider.get_tracking_nonce())[2:]
-        client_order_id = f"{client_operation_id_prefix}{side}{base_str}{quote_str}{ts_hex}{self._client_instance_id}"
+        cache_key = (client_operation_id_prefix, is_buy, trading_pair)
+        id_prefix = self._order_id_prefix_cache.get(cache_key)
+        if id_prefix is None:
+            base = trading_pair.base
+            quote = trading_pair.quote
+            side = "B" if is_buy else "S"  # 1 char
+            base_str = f"{base[0]}{base[-1]}"  # 2 chars
+            quote_str = f"{quote[0]}{quote[-1]}"  # 2 chars
+            id_prefix = f"{client_operation_id_prefix}{side}{base_str}{quote_str}"
+            self._order_id_prefix_cache[cache_key] = id_prefix
+
+        ts_hex = hex(self._get_tracking_nonce())[2:]
+        client_order_id = f"{id_prefix}{ts_hex}{self._client_instance_id}"
 
         if max_id_len is not None:
-            id_prefix = f"{client_operation_id_prefix}{side}{base_str}{quote_str}"
             suffix_max_length = max_id_len - len(id_prefix)
             if suffix_max_length < len(ts_hex):
-                id_suffix = md5(
-                    f"{ts_hex}{self._client_instance_id}".encode()
-                ).hexdigest()
+                # shake_128 is an extendable-output function: ask for just
+                # enough bytes instead of hashing to a full fixed digest
+                # and slicing most of it away.
+                id_suffix = shake_128(
+                    ts_hex.encode("ascii") + self._client_instance_id_bytes
+                ).hexdigest((suffix_max_length + 1) // 2)
                 client_order_id = f"{id_prefix}{id_suffix[:suffix_max_length]}"
             else:
                 client_order_id = client_order_id[:max_id_len]
@@ -364,10 +502,27 @@ class Exchange(Operator):
         order_details: OrderDetails,
         client_operation_id_prefix: str = "",
     ) -> str:
+        # Inlined order creation: prepare, track and schedule in one frame
+        # instead of dispatching through _create_order per order.
         client_order_id = self.get_new_client_operation_id(
             order_details, client_operation_id_prefix=client_operation_id_prefix
         )
-        self._create_order(account, client_order_id, order_details)
+        order_details = self.prepare_order_details(order_details)
+
+        self.start_tracking_order(
+            account,
+            client_order_id,
+            order_details,
+        )
+
+        asyncio.get_running_loop().create_task(
+            self._request_create_order(
+                account=account,
+                client_order_id=client_order_id,
+                order_details=order_details,
+            ),
+            name=f"create_order:{client_order_id}",
+        )
         return client_order_id
 
     @abstractmethod
@@ -382,6 +537,11 @@ class Exchange(Operator):
     def _create_order(
         self, account: Owner, client_order_id: str, order_details: OrderDetails
     ) -> None:
+        """Legacy entry point for callers that already have an order id.
+
+        place_order inlines these steps on the hot path; this helper stays
+        for subclasses and tooling that drive creation directly.
+        """
         order_details = self.prepare_order_details(order_details)
 
         self.start_tracking_order(
@@ -395,7 +555,8 @@ class Exchange(Operator):
                 account=account,
                 client_order_id=client_order_id,
                 order_details=order_details,
-            )
+            ),
+            name=f"create_order:{client_order_id}",
         )
 
     async def _request_create_order(
@@ -420,7 +581,8 @@ class Exchange(Operator):
                 else OrderState.PENDING_CREATE
             )
 
-            order_update: OrderUpdate = OrderUpdate(
+            # Fields are already typed here, so validation is skipped.
+            order_update: OrderUpdate = OrderUpdate.model_construct(
                 client_order_id=client_order_id,
                 exchange_order_id=exchange_order_id,
                 trading_pair=order_details.trading_pair,
@@ -456,7 +618,7 @@ class Exchange(Operator):
         if exception is not None:
             self.logger().error(f"Error placing order {client_order_id}: {exception}")
 
-        order_update: OrderUpdate = OrderUpdate(
+        order_update: OrderUpdate = OrderUpdate.model_construct(
             client_order_id=client_order_id,
             trading_pair=order_details.trading_pair,
             update_timestamp=self.current_timestamp,
@@ -468,6 +630,30 @@ class Exchange(Operator):
     def process_order_update(self, account: Owner, order_update: OrderUpdate) -> None:
         raise NotImplementedError
 
+    def register_order_update_handler(
+        self, state: OrderState, handler: Callable[[Owner, OrderUpdate], None]
+    ) -> None:
+        """Register a per-state order update handler.
+
+        Subclasses whose process_order_update is a state if/elif ladder can
+        instead register one handler per OrderState in their constructor and
+        route updates through _dispatch_order_update: a single dict lookup
+        plus call per update.
+        """
+        self._order_update_handlers[state] = handler
+
+    def _dispatch_order_update(self, account: Owner, order_update: OrderUpdate) -> bool:
+        """Dispatch an update to its registered handler, if any.
+
+        Returns:
+            bool: True if a handler was registered for the update's state
+        """
+        handler = self._order_update_handlers.get(order_update.new_state)
+        if handler is None:
+            return False
+        handler(account, order_update)
+        return True
+
     @abstractmethod
     def get_tracked_order(self, account: Owner, order_id: str) -> OrderOperation | None:
         raise NotImplementedError
@@ -485,7 +671,10 @@ class Exchange(Operator):
     # === Cancel Functions ===
 
     def cancel(self, account: Owner, order_id: str) -> None:
-        asyncio.get_running_loop().create_task(self._execute_cancel(account, order_id))
+        asyncio.get_running_loop().create_task(
+            self._execute_cancel(account, order_id),
+            name=f"cancel_order:{order_id}",
+        )
 
     async def _execute_cancel(self, account: Owner, order_id: str) -> None:
         tracked_order = self.get_tracked_order(account, order_id)
@@ -511,7 +700,7 @@ class Exchange(Operator):
                 f"Failed to cancel order {order.client_operation_id}", exc_info=True
             )
 
-            order_update: OrderUpdate = OrderUpdate(
+            order_update: OrderUpdate = OrderUpdate.model_construct(
                 client_order_id=order.client_operation_id,
                 trading_pair=order.trading_pair,
                 update_timestamp=self.current_timestamp,
@@ -532,11 +721,57 @@ class Exchange(Operator):
     ) -> bool:
         raise NotImplementedError
 
+    # Maximum number of orders sent to the exchange per bulk-cancel request.
+    max_batch_cancel_size: int = 20
+
     def cancel_batch(self, account: Owner, order_ids: list[str]) -> None:
         asyncio.get_running_loop().create_task(
-            self._place_batch_cancel(account, order_ids)
+            self._place_batch_cancel(account, order_ids),
+            name="cancel_batch",
         )
 
     async def _place_batch_cancel(self, account: Owner, order_ids: list[str]) -> None:
-        tasks = [self._execute_cancel(account, order_id) for order_id in order_ids]
+        tracked_orders = [
+            tracked_order
+            for order_id in order_ids
+            if (tracked_order := self.get_tracked_order(account, order_id)) is not None
+        ]
+        if not tracked_orders:
+            return
+
+        batch_size = self.max_batch_cancel_size
+        batches = [
+            tracked_orders[start : start + batch_size]
+            for start in range(0, len(tracked_orders), batch_size)
+        ]
+        # One shared context for the whole batch: the event loop runs task
+        # steps sequentially, so siblings can reuse a single Context instead
+        # of copying the current one per task.
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        tasks = [
+            loop.create_task(
+                self._place_batch_cancel_request(account, batch), context=context
+            )
+            for batch in batches
+        ]
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _place_batch_cancel_request(
+        self, account: Owner, tracked_orders: list[OrderOperation]
+    ) -> None:
+        """Cancel a batch of tracked orders with the exchange.
+
+        The default implementation falls back to one cancel request per
+        order. Exchanges that expose a bulk-cancel endpoint should override
+        this to cancel the whole batch in a single round trip.
+        """
+        loop = asyncio.get_running_loop()
+        context = contextvars.copy_context()
+        tasks = [
+            loop.create_task(
+                self._execute_order_cancel(account, tracked_order), context=context
+            )
+            for tracked_order in tracked_orders
+        ]
         await asyncio.gather(*tasks, return_exceptions=True)
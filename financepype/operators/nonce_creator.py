@@ -24,6 +24,8 @@ class NonceCreator:
         >>> nonce2 = creator.get_tracking_nonce()  # e.g., 1641234567001
     """
 
+    __slots__ = ("_precision", "_precision_ns_divisor", "_last_tracking_nonce")
+
     SECONDS_PRECISION = 1
     MILLISECONDS_PRECISION = 1000
     MICROSECONDS_PRECISION = 1000000
@@ -35,6 +37,9 @@ class NonceCreator:
             precision (int): The precision multiplier for timestamps
         """
         self._precision = int(precision)
+        # Integer divisor from nanoseconds, so the no-timestamp path stays
+        # in integer arithmetic (no float multiply).
+        self._precision_ns_divisor = 1_000_000_000 // self._precision
         self._last_tracking_nonce = 0
 
     @classmethod
@@ -77,22 +82,21 @@ class NonceCreator:
         Returns:
             int: A unique, monotonically increasing nonce value
         """
-        nonce_candidate = int((timestamp or self._time()) * self._precision)
-        self._last_tracking_nonce = (
-            nonce_candidate
-            if nonce_candidate > self._last_tracking_nonce
-            else self._last_tracking_nonce + 1
-        )
+        if timestamp:
+            nonce_candidate = int(timestamp * self._precision)
+        else:
+            nonce_candidate = self._time_ns() // self._precision_ns_divisor
+        self._last_tracking_nonce = max(nonce_candidate, self._last_tracking_nonce + 1)
         return self._last_tracking_nonce
 
     @staticmethod
-    def _time() -> float:
-        """Get the current time.
+    def _time_ns() -> int:
+        """Get the current time in nanoseconds.
 
         This method is separated to allow mocking in tests without
         affecting the system time.
 
         Returns:
-            float: Current Unix timestamp
+            int: Current Unix timestamp in nanoseconds
         """
-        return time.time()
+        return time.time_ns()
@@ -33,6 +33,15 @@ class Operator:
         >>> print(operator.name)  # Output: "binance"
     """
 
+    __slots__ = (
+        "_configuration",
+        "_microseconds_nonce_provider",
+        "_get_tracking_nonce",
+        "_client_instance_id",
+        "_client_instance_id_bytes",
+        "_event_publishing",
+    )
+
     _logger: logging.Logger | None = None
 
     def __init__(self, configuration: OperatorConfiguration):
@@ -46,7 +55,12 @@ class Operator:
         self._configuration = configuration
 
         self._microseconds_nonce_provider = NonceCreator.for_microseconds()
+        # Bound once: order id generation calls this per order, so it skips
+        # the provider attribute chain and method dispatch.
+        self._get_tracking_nonce = self._microseconds_nonce_provider.get_tracking_nonce
         self._client_instance_id = get_instance_id()
+        # Pre-encoded once: the id is hashed on every truncated order id.
+        self._client_instance_id_bytes = self._client_instance_id.encode("ascii")
 
         self._event_publishing = MultiPublisher()
 
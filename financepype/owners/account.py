@@ -9,8 +9,7 @@ class AccountIdentifier(OwnerIdentifier):
     platform: CentralizedPlatform
     name: str
 
-    @property
-    def identifier(self) -> str:
+    def _build_identifier(self) -> str:
         return f"{self.platform.identifier}:{self.name}"
 
 
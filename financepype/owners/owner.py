@@ -1,12 +1,13 @@
 import asyncio
 import logging
+import sys
 from abc import abstractmethod
 from collections.abc import Mapping
 from decimal import Decimal
 from typing import Any, cast
 
 from eventspype.pub.multipublisher import MultiPublisher
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 from financepype.assets.asset import Asset
 from financepype.assets.contract import DerivativeContract, DerivativeSide
@@ -48,6 +49,38 @@ class OwnerIdentifier(BaseModel):
     platform: Platform = Field(description="The platform the owner belongs to")
     name: str | None = Field(description="The name of the owner")
 
+    # Caches set in model_post_init on the frozen model.
+    _identifier: str = ""
+    _hash: int = 0
+
+    @field_validator("name")
+    @classmethod
+    def intern_name(cls, v: str | None) -> str | None:
+        """Intern the owner name.
+
+        Names come from a small vocabulary and are compared whenever
+        identifiers collide, so interning makes equality a pointer
+        comparison.
+        """
+        return sys.intern(v) if v is not None else None
+
+    def model_post_init(self, __context: Any) -> None:
+        """Cache the identifier string and hash of the frozen identity.
+
+        Owner identifiers are used as dict/set keys in balance and owner
+        tracking, so the f-string assembly and hashing happen once here
+        instead of on every lookup. The identifier string is interned so
+        equal identifiers usually compare by pointer.
+        """
+        object.__setattr__(self, "_identifier", sys.intern(self._build_identifier()))
+        object.__setattr__(self, "_hash", hash(self._identifier))
+
+    def _build_identifier(self) -> str:
+        """Assemble the identifier string; subclasses override the format."""
+        if self.name is None:
+            return f"{self.platform.identifier}:unknown"
+        return f"{self.platform.identifier}:{self.name}"
+
     @property
     def identifier(self) -> str:
         """Get the unique identifier string.
@@ -58,9 +91,26 @@ class OwnerIdentifier(BaseModel):
         Returns:
             str: The combined unique identifier
         """
-        if self.name is None:
-            return f"{self.platform.identifier}:unknown"
-        return f"{self.platform.identifier}:{self.name}"
+        identifier: str = self._identifier
+        return identifier
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        """Compare identifiers with cheap pre-checks before the field compare.
+
+        Identity handles the common case of shared instances, and the
+        precomputed hashes rule out most mismatches without touching the
+        fields. The pydantic field comparison remains the authority, since
+        subclasses carry fields (e.g. wallet addresses) that the identifier
+        string alone does not encode.
+        """
+        if self is other:
+            return True
+        if isinstance(other, OwnerIdentifier) and self._hash != other._hash:
+            return False
+        return super().__eq__(other)
 
     def __repr__(self) -> str:
         """Get the string representation of the owner identifier.
@@ -116,9 +166,13 @@ class Owner(MultiPublisher):
         super().__init__()
 
         self._configuration = configuration
+        self._platform = configuration.identifier.platform
 
         self._balance_tracker = BalanceTracker()
         self._balances_ready = asyncio.Event()
+        self._asset_cache: dict[tuple[str, DerivativeSide | None], Asset] = {}
+        self._total_balance_by_currency: dict[str, Decimal] = {}
+        self._total_balance_version = -1
 
     @classmethod
     def logger(cls) -> logging.Logger:
@@ -157,7 +211,7 @@ class Owner(MultiPublisher):
         Returns:
             Platform: The trading platform
         """
-        return self.identifier.platform
+        return self._platform
 
     @property
     def balance_tracker(self) -> BalanceTracker:
@@ -173,6 +227,32 @@ class Owner(MultiPublisher):
     def current_timestamp(self) -> float:
         raise NotImplementedError
 
+    def _resolve_asset(
+        self, currency: str, side: DerivativeSide | None = None
+    ) -> Asset:
+        """Resolve a currency name to an asset, memoized per owner.
+
+        The owner's platform never changes, so balance and position lookups
+        can reuse resolved assets instead of going through the factory on
+        every call.
+
+        Args:
+            currency (str): Currency or trading pair identifier
+            side (DerivativeSide | None): Position side for derivative contracts
+
+        Returns:
+            Asset: The resolved asset
+        """
+        cache_key = (currency, side)
+        asset = self._asset_cache.get(cache_key)
+        if asset is None:
+            if side is None:
+                asset = AssetFactory.get_asset(self._platform, currency)
+            else:
+                asset = AssetFactory.get_asset(self._platform, currency, side=side)
+            self._asset_cache[cache_key] = asset
+        return asset
+
     # === Balances Management ===
 
     def get_available_balance(self, currency: str) -> Decimal:
@@ -184,7 +264,7 @@ class Owner(MultiPublisher):
         Returns:
             Decimal: Available balance amount
         """
-        asset = AssetFactory.get_asset(self.platform, currency)
+        asset = self._resolve_asset(currency)
         return self.balance_tracker.get_balance(asset, BalanceType.AVAILABLE)
 
     def get_all_available_balances(self) -> dict[str, Decimal]:
@@ -194,7 +274,7 @@ class Owner(MultiPublisher):
             dict[str, Decimal]: Map of currency to available balance
         """
         return {
-            asset.identifier.value: amount
+            asset.value_str: amount
             for asset, amount in self.balance_tracker.available_balances.items()
         }
 
@@ -205,7 +285,7 @@ class Owner(MultiPublisher):
             dict[str, Decimal]: Map of currency to total balance
         """
         return {
-            asset.identifier.value: amount
+            asset.value_str: amount
             for asset, amount in self.balance_tracker.total_balances.items()
         }
 
@@ -218,15 +298,33 @@ class Owner(MultiPublisher):
         Returns:
             Decimal: Total balance amount
         """
-        asset = AssetFactory.get_asset(self.platform, currency)
-        self.logger().debug(
-            f"[Owner:GetBalance] Getting balance for {currency} (asset={asset}, platform={self.platform}, asset_hash={hash(asset)})"
-        )
+        # Hot path: a currency-keyed shadow of the tracker's total balances.
+        # The tracker bumps its version on every total-balance mutation
+        # (including direct balance_tracker calls and position updates), so
+        # the shadow is rebuilt lazily whenever it is stale.
+        tracker_version = self.balance_tracker.total_balances_version
+        if tracker_version != self._total_balance_version:
+            self._total_balance_by_currency = {
+                asset.value_str: amount
+                for asset, amount in self.balance_tracker.total_balances.items()
+            }
+            self._total_balance_version = tracker_version
+        balance = self._total_balance_by_currency.get(currency)
+        if balance is not None:
+            return balance
+        asset = self._resolve_asset(currency)
+        logger = self.logger()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                f"[Owner:GetBalance] Getting balance for {currency} (asset={asset}, platform={self.platform}, asset_hash={hash(asset)})"
+            )
         balance = self.balance_tracker.get_balance(asset, BalanceType.TOTAL)
-        self.logger().debug(f"[Owner:GetBalance] Balance for {currency} is {balance}")
-        self.logger().debug(
-            f"[Owner:GetBalance] Total balances: {self.balance_tracker._total_balances}"
-        )
+        if debug_enabled:
+            logger.debug(f"[Owner:GetBalance] Balance for {currency} is {balance}")
+            logger.debug(
+                f"[Owner:GetBalance] Total balances: {self.balance_tracker._total_balances}"
+            )
         return balance
 
     def set_balances(
@@ -251,17 +349,20 @@ class Owner(MultiPublisher):
         Returns:
             tuple[dict[str, Decimal], dict[str, Decimal]]: Updated total and available balances
         """
-        self.logger().debug(
-            f"[Owner:SetBalances] Setting balances for platform {self.platform}:"
-        )
-        for asset, amount in total_balances:
-            self.logger().debug(
-                f"  Total balance: {amount} of {asset} (hash={hash(asset)})"
-            )
-        for asset, amount in available_balances:
-            self.logger().debug(
-                f"  Available balance: {amount} of {asset} (hash={hash(asset)})"
+        logger = self.logger()
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug(
+                f"[Owner:SetBalances] Setting balances for platform {self.platform}:"
             )
+            for asset, amount in total_balances:
+                logger.debug(
+                    f"  Total balance: {amount} of {asset} (hash={hash(asset)})"
+                )
+            for asset, amount in available_balances:
+                logger.debug(
+                    f"  Available balance: {amount} of {asset} (hash={hash(asset)})"
+                )
 
         total_balance_changes = self.balance_tracker.set_balances(
             total_balances,
@@ -276,38 +377,36 @@ class Owner(MultiPublisher):
             complete_snapshot,
         )
 
-        self.logger().debug(
-            f"[Owner:SetBalances] Total balances after update: {self.balance_tracker._total_balances}"
-        )
-        self.logger().debug(
-            f"[Owner:SetBalances] Available balances after update: {self.balance_tracker._available_balances}"
-        )
-
-        updated_total_balances = {}
-        for balance_change in total_balance_changes:
-            if balance_change.amount == s_decimal_0:
-                continue
-            updated_total_balances[balance_change.asset.identifier.value] = (
-                self.balance_tracker.get_balance(
-                    balance_change.asset, BalanceType.TOTAL
-                )
+        if debug_enabled:
+            logger.debug(
+                f"[Owner:SetBalances] Total balances after update: {self.balance_tracker._total_balances}"
+            )
+            logger.debug(
+                f"[Owner:SetBalances] Available balances after update: {self.balance_tracker._available_balances}"
             )
 
-        updated_available_balances = {}
-        for balance_change in available_balance_changes:
-            if balance_change.amount == s_decimal_0:
-                continue
-            updated_available_balances[balance_change.asset.identifier.value] = (
-                self.balance_tracker.get_balance(
-                    balance_change.asset, BalanceType.AVAILABLE
-                )
+        tracked_total = self.balance_tracker.total_balances
+        tracked_available = self.balance_tracker.available_balances
+        updated_total_balances = {
+            balance_change.asset.value_str: tracked_total.get(
+                balance_change.asset, s_decimal_0
+            )
+            for balance_change in total_balance_changes
+            if balance_change.amount != s_decimal_0
+        }
+        updated_available_balances = {
+            balance_change.asset.value_str: tracked_available.get(
+                balance_change.asset, s_decimal_0
             )
+            for balance_change in available_balance_changes
+            if balance_change.amount != s_decimal_0
+        }
 
-        if updated_total_balances or updated_available_balances:
-            self.logger().debug(
+        if debug_enabled and (updated_total_balances or updated_available_balances):
+            logger.debug(
                 f"[Owner:SetBalances] New Total Balances: {updated_total_balances}"
             )
-            self.logger().debug(
+            logger.debug(
                 f"[Owner:SetBalances] New Available Balances: {updated_available_balances}"
             )
 
@@ -327,7 +426,7 @@ class Owner(MultiPublisher):
         """
         asset = cast(
             DerivativeContract,
-            AssetFactory.get_asset(self.platform, trading_pair, side=side),
+            self._resolve_asset(trading_pair, side=side),
         )
         return self.balance_tracker.get_position(asset)
 
@@ -345,10 +444,7 @@ class Owner(MultiPublisher):
         Args:
             position (Position): The position to set
         """
-        self.balance_tracker.set_position(position, "Set Position", BalanceType.TOTAL)
-        self.balance_tracker.set_position(
-            position, "Set Position", BalanceType.AVAILABLE
-        )
+        self.balance_tracker.set_position(position, "Set Position")
 
     def remove_position(
         self, trading_pair: TradingPair, side: DerivativeSide
@@ -367,7 +463,7 @@ class Owner(MultiPublisher):
 
         asset = cast(
             DerivativeContract,
-            AssetFactory.get_asset(self.platform, trading_pair.name, side=side),
+            self._resolve_asset(trading_pair.name, side=side),
         )
         return self.balance_tracker.remove_position(asset)
 
@@ -26,17 +26,8 @@ class BlockchainWalletIdentifier(OwnerIdentifier):
     platform: BlockchainPlatform
     address: BlockchainIdentifier
 
-    @property
-    def identifier(self) -> str:
-        """
-        Get the unique identifier string for the wallet.
-
-        The identifier combines the platform identifier and wallet address
-        in the format "platform:address".
-
-        Returns:
-            str: The combined unique identifier string
-        """
+    def _build_identifier(self) -> str:
+        """Combine the platform identifier with the name or wallet address."""
         if self.name is not None:
             return f"{self.platform.identifier}:{self.name}"
         return f"{self.platform.identifier}:{self.address.string}"
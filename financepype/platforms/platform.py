@@ -1,6 +1,7 @@
+import sys
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 _platform_cache: dict[str, "Platform"] = {}
 """Global cache of platform instances to ensure uniqueness."""
@@ -37,6 +38,35 @@ class Platform(BaseModel):
         description="Unique identifier for the platform. Must be non-empty.",
     )
 
+    # Cache set in model_post_init on the frozen model.
+    _hash: int = 0
+
+    @field_validator("identifier")
+    @classmethod
+    def intern_identifier(cls, v: str) -> str:
+        """Intern the identifier string.
+
+        Platform identifiers form a small vocabulary and are compared
+        constantly, so interning makes equality a pointer comparison.
+        """
+        return sys.intern(v)
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute the hash over all fields, since the model is frozen."""
+        object.__setattr__(self, "_hash", hash((type(self), *self.__dict__.values())))
+
+    def __hash__(self) -> int:
+        cached: int = self._hash
+        return cached
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare platforms, short-circuiting on identity.
+
+        Thanks to the instance cache most comparisons are between the
+        same object, so the field-by-field pydantic comparison rarely runs.
+        """
+        return self is other or super().__eq__(other)
+
     def __new__(cls, **data: Any) -> "Platform":
         """Create or retrieve a cached platform instance.
 
@@ -71,12 +101,17 @@ class Platform(BaseModel):
         """Initialize a platform instance.
 
         This method initializes the platform and adds it to the cache.
-        Due to the caching mechanism in __new__, this will only be called
-        for new platform instances.
+        Python still invokes ``__init__`` when ``__new__`` returns a cached
+        instance, so initialization is skipped for instances that are
+        already validated.
 
         Args:
             **data: Keyword arguments including 'identifier' for the platform
         """
+        if "identifier" in self.__dict__:
+            # Cached instance returned by __new__: fields are already
+            # validated, so skip the pydantic re-validation pass.
+            return
         super().__init__(**data)
         if self.identifier:  # Only cache if identifier is valid
             cache_key = f"{self.__class__.__name__}:{self.identifier}"
@@ -1,5 +1,7 @@
-from datetime import datetime
-from decimal import Decimal
+import time
+from collections.abc import Iterable, Mapping
+from decimal import ROUND_DOWN, Decimal
+from functools import cached_property
 from typing import Any, Self
 
 from pydantic import (
@@ -15,6 +17,21 @@ from financepype.constants import s_decimal_0, s_decimal_max, s_decimal_min
 from financepype.markets.trading_pair import TradingPair
 from financepype.operations.orders.models import OrderModifier, OrderType
 
+# 1% safety factor applied to the minimum notional check, interned once
+# instead of being parsed from a string per order.
+_DEC_1_01 = Decimal("1.01")
+
+# Decimal-typed TradingRule fields pre-parsed by the bulk loader.
+_DECIMAL_FIELDS = (
+    "min_order_size",
+    "max_order_size",
+    "min_price_increment",
+    "min_base_amount_increment",
+    "min_quote_amount_increment",
+    "min_notional_size",
+    "max_notional_size",
+)
+
 
 class TradingRule(BaseModel):
     """Trading rules and constraints for a specific trading pair.
@@ -151,11 +168,55 @@ class TradingRule(BaseModel):
         default=True,
         description="Whether trading is currently enabled",
     )
+    use_float_quantize: bool = Field(
+        default=False,
+        description=(
+            "Opt-in float fast path for amount quantization; only safe when "
+            "the increments fit IEEE-754 doubles without rounding loss"
+        ),
+    )
     other_rules: dict[str, Any] = Field(
         default_factory=dict,
         description="Additional platform-specific rules",
     )
 
+    @classmethod
+    def bulk_from_payload(cls, payload: Iterable[Mapping[str, Any]]) -> list[Self]:
+        """Build many rules from known-good field mappings without validation.
+
+        Connectors ingest hundreds of rules per exchange snapshot; going
+        through full pydantic validation for each one is the dominant cost.
+        This path uses model_construct and replicates the two validators by
+        hand: trading pairs given as strings/dicts are coerced once, the
+        Decimal fields are parsed once, and collateral-token defaulting is
+        applied after construction.
+
+        Only use this for server-validated payloads; malformed input that
+        model validation would reject passes through unchecked here.
+
+        Args:
+            payload: Field mappings, one per rule
+
+        Returns:
+            list[Self]: The constructed rules
+        """
+        rules: list[Self] = []
+        for row in payload:
+            fields = dict(row)
+            trading_pair = fields.get("trading_pair")
+            if isinstance(trading_pair, str):
+                fields["trading_pair"] = TradingPair(name=trading_pair)
+            elif isinstance(trading_pair, dict):
+                fields["trading_pair"] = TradingPair.model_validate(trading_pair)
+            for name in _DECIMAL_FIELDS:
+                value = fields.get(name)
+                if value is not None and not isinstance(value, Decimal):
+                    fields[name] = Decimal(str(value))
+            rule = cls.model_construct(**fields)
+            rule._apply_default_collateral_tokens()
+            rules.append(rule)
+        return rules
+
     @field_validator("trading_pair", mode="before")
     @classmethod
     def validate_trading_pair(
@@ -186,20 +247,27 @@ class TradingRule(BaseModel):
     def fix_collateral_tokens(self) -> Self:
         """Set default collateral tokens if not specified.
 
+        Returns:
+            Self: The validated instance
+        """
+        self._apply_default_collateral_tokens()
+        return self
+
+    def _apply_default_collateral_tokens(self) -> None:
+        """Set default collateral tokens if not specified.
+
         For buy orders: Uses quote currency as collateral
         For sell orders: Uses base currency as collateral
 
         This method ensures that collateral tokens are always set to valid
-        values, using the trading pair's base and quote currencies as defaults.
-
-        Returns:
-            Self: The validated instance
+        values, using the trading pair's base and quote currencies as
+        defaults. It is shared between the after-validator and
+        bulk_from_payload, which bypasses validation.
         """
         if self.buy_order_collateral_token is None:
             self.buy_order_collateral_token = self.trading_pair.quote
         if self.sell_order_collateral_token is None:
             self.sell_order_collateral_token = self.trading_pair.base
-        return self
 
     @property
     def active(self) -> bool:
@@ -278,16 +346,115 @@ class TradingRule(BaseModel):
         """
         return True
 
-    @property
+    @cached_property
+    def min_notional_size_with_safety(self) -> Decimal:
+        """Minimum notional size with a 1% safety factor applied.
+
+        Computed once per rule instance so the order quantization hot path
+        does not repeat the Decimal multiplication. Rules are replaced (not
+        mutated) on refresh, so the cached value cannot go stale.
+
+        Returns:
+            Decimal: min_notional_size * 1.01
+        """
+        return self.min_notional_size * _DEC_1_01
+
+    @cached_property
+    def _price_tick_is_pow10(self) -> bool:
+        """Whether the price tick is a power of ten (single mantissa digit)."""
+        return self.min_price_increment.as_tuple().digits == (1,)
+
+    @cached_property
+    def _base_amount_tick_is_pow10(self) -> bool:
+        """Whether the base amount tick is a power of ten."""
+        return self.min_base_amount_increment.as_tuple().digits == (1,)
+
+    def quantize_price(self, price: Decimal) -> Decimal:
+        """Floor a price to this rule's tick size.
+
+        For power-of-ten ticks (the common case) this uses ``quantize``,
+        which works on the integer mantissa in C instead of going through
+        a Decimal division and multiplication. The tick classification is
+        computed once per rule instance.
+
+        Args:
+            price (Decimal): The raw price
+
+        Returns:
+            Decimal: The price floored to a multiple of min_price_increment
+        """
+        if self._price_tick_is_pow10:
+            return price.quantize(self.min_price_increment, rounding=ROUND_DOWN)
+        return (price // self.min_price_increment) * self.min_price_increment
+
+    def quantize_amount(self, amount: Decimal) -> Decimal:
+        """Floor a base amount to this rule's amount increment.
+
+        Args:
+            amount (Decimal): The raw base amount
+
+        Returns:
+            Decimal: The amount floored to a multiple of min_base_amount_increment
+        """
+        if self._base_amount_tick_is_pow10:
+            return amount.quantize(self.min_base_amount_increment, rounding=ROUND_DOWN)
+        return (
+            amount // self.min_base_amount_increment
+        ) * self.min_base_amount_increment
+
+    def quantize_prices_array(self, prices: Any) -> Any:
+        """Floor an array of float prices to this rule's tick size.
+
+        Vectorized float64 counterpart of quantize_price for backtesting
+        and bulk order generation, where thousands of candidate prices are
+        snapped against one rule at a time. The Decimal tick is converted
+        once and the floor runs as a single numpy expression.
+
+        Exactness-critical paths (live order placement) should keep using
+        the Decimal quantize_price; float64 rounding is acceptable only
+        for simulation-grade work.
+
+        Args:
+            prices: Array-like of float prices
+
+        Returns:
+            np.ndarray: Prices floored to multiples of min_price_increment
+        """
+        import numpy as np
+
+        tick = float(self.min_price_increment)
+        prices = np.asarray(prices, dtype=np.float64)
+        return np.floor(prices / tick) * tick
+
+    def quantize_amounts_array(self, amounts: Any) -> Any:
+        """Floor an array of float amounts to this rule's amount increment.
+
+        Args:
+            amounts: Array-like of float base amounts
+
+        Returns:
+            np.ndarray: Amounts floored to multiples of min_base_amount_increment
+        """
+        import numpy as np
+
+        tick = float(self.min_base_amount_increment)
+        amounts = np.asarray(amounts, dtype=np.float64)
+        return np.floor(amounts / tick) * tick
+
+    @cached_property
     def supports_limit_orders(self) -> bool:
         """Check if limit orders are supported.
 
+        The membership test runs once per rule instance; rules are
+        replaced (not mutated) on refresh, so the cached value cannot
+        go stale.
+
         Returns:
             bool: True if limit orders are supported
         """
         return OrderType.LIMIT in self.supported_order_types
 
-    @property
+    @cached_property
     def supports_market_orders(self) -> bool:
         """Check if market orders are supported.
 
@@ -328,8 +495,7 @@ class DerivativeTradingRule(TradingRule):
         >>> print(future.is_expired())  # False
     """
 
-    @model_validator(mode="after")
-    def fix_collateral_tokens(self) -> Self:
+    def _apply_default_collateral_tokens(self) -> None:
         """Set default collateral tokens if not specified.
 
         For linear instruments, uses quote currency as collateral
@@ -338,9 +504,6 @@ class DerivativeTradingRule(TradingRule):
         This method overrides the base class implementation to handle
         the different collateral requirements of linear and inverse
         derivative contracts.
-
-        Returns:
-            Self: The validated instance
         """
         if self.trading_pair.market_info.is_linear:
             if self.buy_order_collateral_token is None:
@@ -352,7 +515,6 @@ class DerivativeTradingRule(TradingRule):
                 self.buy_order_collateral_token = self.trading_pair.market_info.base
             if self.sell_order_collateral_token is None:
                 self.sell_order_collateral_token = self.trading_pair.market_info.base
-        return self
 
     @field_serializer("strike_price")
     def serialize_strike_price(self, strike_price: Decimal | None) -> str | None:
@@ -413,9 +575,10 @@ class DerivativeTradingRule(TradingRule):
         Returns:
             bool: True if the derivative has expired
         """
-        if self.perpetual:
+        if self.expiry_timestamp == -1:
             return False
-        timestamp = timestamp or datetime.now().timestamp()
+        if timestamp is None:
+            timestamp = time.time()
         return timestamp >= self.expiry_timestamp
 
     def is_started(self, timestamp: int | float | None = None) -> bool:
@@ -430,7 +593,8 @@ class DerivativeTradingRule(TradingRule):
         Returns:
             bool: True if trading has started
         """
-        timestamp = timestamp or datetime.now().timestamp()
+        if timestamp is None:
+            timestamp = time.time()
         return timestamp >= self.start_timestamp
 
     def is_active(self, timestamp: int | float | None = None) -> bool:
@@ -447,5 +611,9 @@ class DerivativeTradingRule(TradingRule):
         Returns:
             bool: True if trading is active
         """
-        ts = timestamp if timestamp is not None else datetime.now().timestamp()
-        return self.is_live and self.is_started(ts) and not self.is_expired(ts)
+        ts = timestamp if timestamp is not None else time.time()
+        return (
+            self.is_live
+            and ts >= self.start_timestamp
+            and (self.expiry_timestamp == -1 or ts < self.expiry_timestamp)
+        )
@@ -20,8 +20,7 @@ Example:
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-
-from bidict import bidict
+from collections.abc import Mapping
 
 from financepype.markets.trading_pair import TradingPair
 from financepype.rules.trading_rule import TradingRule
@@ -34,17 +33,19 @@ class TradingRulesTracker(ABC):
     and symbol mappings for a specific exchange. It ensures thread-safe access to
     the data and provides methods for validating trading pairs and symbols.
 
-    The class uses a bidirectional mapping between exchange-specific symbols and
-    standardized trading pair formats, allowing for easy conversion in both directions.
-    All operations are thread-safe and support asynchronous access.
+    The class keeps two plain dicts mapping exchange-specific symbols to
+    standardized trading pairs and back, allowing for easy conversion in both
+    directions. All operations are thread-safe and support asynchronous access.
 
     The actual implementation of rule updates should be provided by exchange-specific
     subclasses through the update_trading_rules method.
 
     Attributes:
         _trading_rules (dict[str, TradingRule]): Current trading rules by trading pair
-        _trading_pair_symbol_map (bidict[str, str] | None): Bidirectional symbol mapping
-        _mapping_initialization_lock (asyncio.Lock): Lock for thread-safe updates
+        _pair_to_symbol (dict[TradingPair, str]): Trading pair to exchange symbol map
+        _symbol_to_pair (dict[str, TradingPair]): Exchange symbol to trading pair map
+        _mapping_initialization_lock (asyncio.Lock | None): Lazily created lock
+            for thread-safe updates
 
     Example:
         >>> tracker = MyExchangeTracker()
@@ -63,8 +64,12 @@ class TradingRulesTracker(ABC):
         mappings should be populated by calling update_trading_rules.
         """
         self._trading_rules: dict[TradingPair, TradingRule] = {}
-        self._trading_pair_symbol_map: bidict[TradingPair, str] = bidict()
-        self._mapping_initialization_lock = asyncio.Lock()
+        self._pair_to_symbol: dict[TradingPair, str] = {}
+        self._symbol_to_pair: dict[str, TradingPair] = {}
+        self._pairs_tuple: tuple[TradingPair, ...] = ()
+        self._symbols_tuple: tuple[str, ...] = ()
+        self._ready = False
+        self._mapping_initialization_lock: asyncio.Lock | None = None
 
     @classmethod
     def logger(cls) -> logging.Logger:
@@ -98,7 +103,8 @@ class TradingRulesTracker(ABC):
         Returns:
             bool: True if an update is in progress
         """
-        return self._mapping_initialization_lock.locked()
+        lock = self._mapping_initialization_lock
+        return lock is not None and lock.locked()
 
     @property
     def is_ready(self) -> bool:
@@ -112,57 +118,75 @@ class TradingRulesTracker(ABC):
         """
         return self.trading_pair_symbol_map_ready()
 
-    async def trading_pair_symbol_map(self) -> bidict[TradingPair, str]:
-        """Get the bidirectional mapping between exchange symbols and trading pairs.
+    async def trading_pair_symbol_map(self) -> Mapping[TradingPair, str]:
+        """Get the mapping between trading pairs and exchange symbols.
 
         This method provides thread-safe access to the symbol mapping. If the
         mapping hasn't been initialized, it will trigger an update of the
         trading rules.
 
         Returns:
-            bidict[TradingPair, str]: Bidirectional mapping between exchange symbols and trading pairs
+            Mapping[TradingPair, str]: Mapping from trading pairs to exchange symbols
+        """
+        if self._ready:
+            # Initialized trackers skip the lock entirely: the hot path is
+            # a single boolean load.
+            return self._pair_to_symbol
+        async with self._get_initialization_lock():
+            if not self._ready:
+                await self.update_trading_rules()
+        return self._pair_to_symbol
+
+    def _get_initialization_lock(self) -> asyncio.Lock:
+        """Get the initialization lock, creating it on first use.
+
+        The lock is created lazily so that constructing a tracker outside
+        a running event loop neither binds it to a loop nor pays for a
+        lock it may never need.
         """
-        if not self.is_ready:
-            async with self._mapping_initialization_lock:
-                if not self.is_ready:
-                    await self.update_trading_rules()
-        current_map = self._trading_pair_symbol_map
-        return current_map
+        lock = self._mapping_initialization_lock
+        if lock is None:
+            lock = asyncio.Lock()
+            self._mapping_initialization_lock = lock
+        return lock
 
     def trading_pair_symbol_map_ready(self) -> bool:
         """Check if the symbol mapping has been initialized.
 
         The mapping is considered ready when it exists and contains at least
         one entry. This indicates that the initial update was successful.
+        The flag is maintained by set_trading_pair_symbol_map so this check
+        is a single attribute load.
 
         Returns:
             bool: True if the mapping exists and contains entries
         """
-        return len(self._trading_pair_symbol_map) > 0
+        return self._ready
 
-    async def all_trading_pairs(self) -> list[TradingPair]:
+    async def all_trading_pairs(self) -> tuple[TradingPair, ...]:
         """Get all available trading pairs.
 
-        Returns a list of all trading pairs in the standardized format
-        that are currently supported by the exchange.
+        Returns all trading pairs in the standardized format that are
+        currently supported by the exchange. The tuple is built once per
+        rules update and shared between callers, so no copy is made here.
 
         Returns:
-            list[TradingPair]: List of all trading pairs in standardized format
+            tuple[TradingPair, ...]: All trading pairs in standardized format
         """
-        mapping = await self.trading_pair_symbol_map()
-        return list(mapping.keys())
+        await self.trading_pair_symbol_map()
+        return self._pairs_tuple
 
-    async def all_exchange_symbols(self) -> list[str]:
+    async def all_exchange_symbols(self) -> tuple[str, ...]:
         """Get all available exchange symbols.
 
-        Returns a list of all exchange-specific symbols that are
-        currently supported by the exchange.
+        Returns all exchange-specific symbols that are currently supported
+        by the exchange, as a shared tuple built once per rules update.
 
         Returns:
-            list[str]: List of all exchange-specific symbols
+            tuple[str, ...]: All exchange-specific symbols
         """
-        mapping = await self.trading_pair_symbol_map()
-        return list(mapping.values())
+        await self.trading_pair_symbol_map()
+        return self._symbols_tuple
 
     async def exchange_symbol_associated_to_pair(
         self, trading_pair: TradingPair
@@ -201,8 +225,8 @@ class TradingRulesTracker(ABC):
         Raises:
             KeyError: If the symbol is not found in the mapping
         """
-        mapping = await self.trading_pair_symbol_map()
-        return mapping.inverse[symbol]
+        await self.trading_pair_symbol_map()
+        return self._symbol_to_pair[symbol]
 
     async def is_trading_pair_valid(self, trading_pair: TradingPair) -> bool:
         """Check if a trading pair is valid and available for trading.
@@ -231,22 +255,96 @@ class TradingRulesTracker(ABC):
         Returns:
             bool: True if the symbol is valid
         """
-        mapping = await self.trading_pair_symbol_map()
-        return symbol in mapping.inverse
+        await self.trading_pair_symbol_map()
+        return symbol in self._symbol_to_pair
+
+    def exchange_symbol_associated_to_pair_sync(self, trading_pair: TradingPair) -> str:
+        """Resolve a trading pair to its exchange symbol without awaiting.
+
+        Cache-hit variant of exchange_symbol_associated_to_pair for hot
+        paths: it reads the in-memory mapping directly instead of paying a
+        coroutine frame per lookup.
+
+        Args:
+            trading_pair: Trading pair in standardized format
+
+        Returns:
+            str: Exchange-specific symbol
+
+        Raises:
+            RuntimeError: If the mapping has not been initialized yet
+            KeyError: If the trading pair is not found in the mapping
+        """
+        if not self.trading_pair_symbol_map_ready():
+            raise RuntimeError("Trading rules tracker is not ready")
+        return self._pair_to_symbol[trading_pair]
+
+    def trading_pair_associated_to_exchange_symbol_sync(
+        self, symbol: str
+    ) -> TradingPair:
+        """Resolve an exchange symbol to its trading pair without awaiting.
+
+        Cache-hit variant of trading_pair_associated_to_exchange_symbol.
+
+        Args:
+            symbol: Exchange-specific symbol
+
+        Returns:
+            TradingPair: Trading pair in standardized format
+
+        Raises:
+            RuntimeError: If the mapping has not been initialized yet
+            KeyError: If the symbol is not found in the mapping
+        """
+        if not self.trading_pair_symbol_map_ready():
+            raise RuntimeError("Trading rules tracker is not ready")
+        return self._symbol_to_pair[symbol]
+
+    def is_trading_pair_valid_sync(self, trading_pair: TradingPair) -> bool:
+        """Check pair validity against the current in-memory mapping.
+
+        Unlike the async variant this never triggers an update; an
+        uninitialized tracker simply reports the pair as invalid.
+
+        Args:
+            trading_pair: Trading pair to validate
+
+        Returns:
+            bool: True if the trading pair is currently known
+        """
+        return trading_pair in self._pair_to_symbol
+
+    def is_exchange_symbol_valid_sync(self, symbol: str) -> bool:
+        """Check symbol validity against the current in-memory mapping.
+
+        Args:
+            symbol: Exchange symbol to validate
+
+        Returns:
+            bool: True if the symbol is currently known
+        """
+        return symbol in self._symbol_to_pair
 
     def set_trading_pair_symbol_map(
-        self, trading_pair_and_symbol_map: bidict[TradingPair, str]
+        self, trading_pair_and_symbol_map: Mapping[TradingPair, str]
     ) -> None:
         """Update the symbol mapping.
 
         This method should be called by update_trading_rules to set
         the new mapping between exchange symbols and trading pairs.
+        Both lookup directions are rebuilt here once, so reads stay
+        plain dict operations.
 
         Args:
-            trading_pair_and_symbol_map: New bidirectional mapping between
-                exchange symbols and trading pairs
+            trading_pair_and_symbol_map: New mapping from trading pairs to
+                exchange symbols
         """
-        self._trading_pair_symbol_map = trading_pair_and_symbol_map
+        pair_to_symbol = dict(trading_pair_and_symbol_map)
+        self._pair_to_symbol = pair_to_symbol
+        self._symbol_to_pair = {symbol: pair for pair, symbol in pair_to_symbol.items()}
+        self._pairs_tuple = tuple(pair_to_symbol.keys())
+        self._symbols_tuple = tuple(pair_to_symbol.values())
+        self._ready = len(pair_to_symbol) > 0
 
     def set_trading_rules(self, trading_rules: dict[TradingPair, TradingRule]) -> None:
         """Update all trading rules.
@@ -331,3 +429,39 @@ class TradingRulesTracker(ABC):
         Sleeps for a given number of seconds.
         """
         await asyncio.sleep(seconds)
+
+
+class NullTradingRulesTracker(TradingRulesTracker):
+    """Null-object tracker used when no real tracker is installed.
+
+    Behaves like a tracker for an exchange with no known markets: empty
+    rules and mappings, never ready, and every validity check fails. It
+    lets callers delegate unconditionally instead of guarding each call
+    with a None check.
+    """
+
+    async def update_trading_rules(self) -> None:
+        """No-op: the null tracker has no exchange to fetch rules from."""
+        return None
+
+    async def exchange_symbol_associated_to_pair(
+        self, trading_pair: TradingPair
+    ) -> str:
+        """Fall back to the trading pair name as its own symbol."""
+        return trading_pair.name
+
+    async def trading_pair_associated_to_exchange_symbol(
+        self, symbol: str
+    ) -> TradingPair:
+        """Always fail: there is no mapping to resolve symbols against."""
+        raise ValueError("Trading rules tracker is not initialized")
+
+    def exchange_symbol_associated_to_pair_sync(self, trading_pair: TradingPair) -> str:
+        """Fall back to the trading pair name, matching the async variant."""
+        return trading_pair.name
+
+    def trading_pair_associated_to_exchange_symbol_sync(
+        self, symbol: str
+    ) -> TradingPair:
+        """Always fail, matching the async variant."""
+        raise ValueError("Trading rules tracker is not initialized")
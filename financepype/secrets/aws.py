@@ -1,9 +1,10 @@
 import json
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, ClassVar
 
 import boto3
 import boto3.session
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, Field, PrivateAttr, SecretStr
 
 from financepype.secrets.base import (
     ExchangeSecrets,
@@ -11,6 +12,13 @@ from financepype.secrets.base import (
     SubaccountSecrets,
 )
 
+try:  # orjson parses multi-KB secret payloads ~2-3x faster when installed
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional accelerator
+    _loads = json.loads
+
 
 class AWSExchangeSecrets(ExchangesSecrets):
     """Manages exchange secrets stored in AWS Secrets Manager.
@@ -27,6 +35,9 @@ class AWSExchangeSecrets(ExchangesSecrets):
     profile_name: str | None
     secret_names: dict[str, str]
 
+    _validated_secret_names: ClassVar[set[str]] = set()
+    _client: Any = PrivateAttr(default=None)
+
     class SecretsFormatter(BaseModel):
         """Formats AWS Secrets Manager JSON data into ExchangeSecrets objects.
 
@@ -109,17 +120,140 @@ class AWSExchangeSecrets(ExchangesSecrets):
         if exchange_name not in self.secret_names:
             raise ValueError(f"No secrets set for {exchange_name}")
 
+        secret_name = self.secret_names[exchange_name]
         try:
-            dict_secrets: dict[str, Any] = self.get_aws_secret(
-                self.secret_names[exchange_name]
-            )
+            dict_secrets: dict[str, Any] = self.get_aws_secret(secret_name)
             dict_secrets["name"] = exchange_name
         except Exception as e:
             raise ValueError(f"No secrets found for {exchange_name}") from e
 
-        exchange_secrets = self.SecretsFormatter.model_validate(dict_secrets)
+        return self._format_secrets(secret_name, dict_secrets)
+
+    def _format_secrets(
+        self, secret_name: str, dict_secrets: dict[str, Any]
+    ) -> ExchangeSecrets:
+        """Build ExchangeSecrets from a parsed payload.
+
+        Args:
+            secret_name (str): AWS secret name the payload came from
+            dict_secrets (dict[str, Any]): Parsed secret payload
+
+        Returns:
+            ExchangeSecrets: The formatted exchange credentials
+        """
+        if self.trust_source and secret_name in self._validated_secret_names:
+            # The payload shape validated successfully before and the source
+            # is ours, so skip pydantic's per-field validation pass.
+            subaccount_cls = self.SecretsFormatter.SubaccountFormat
+            exchange_secrets = self.SecretsFormatter.model_construct(
+                SUBACCOUNTS=[
+                    subaccount_cls.model_construct(**subaccount)
+                    for subaccount in dict_secrets.get("SUBACCOUNTS", ())
+                ],
+                **{k: v for k, v in dict_secrets.items() if k != "SUBACCOUNTS"},
+            )
+        else:
+            exchange_secrets = self.SecretsFormatter.model_validate(dict_secrets)
+            self._validated_secret_names.add(secret_name)
         return exchange_secrets.get_secrets()
 
+    def update_secrets(self, exchange_names: list[str], **kwargs: Any) -> None:
+        """Update or retrieve credentials for multiple exchanges at once.
+
+        The base implementation fetches secrets serially, paying one AWS
+        round-trip per exchange. This override batches the uncached names
+        through batch_get_secret_value (20 ids per request) and falls back
+        to a thread pool of individual fetches when the client does not
+        support batching.
+
+        Args:
+            exchange_names (list[str]): List of exchange names
+            **kwargs: Additional arguments passed to retrieve_secrets
+
+        Raises:
+            ValueError: If a secret name is not configured or not found
+        """
+        pending = [name for name in exchange_names if name not in self.secrets]
+        if not pending:
+            return
+        for exchange_name in pending:
+            if exchange_name not in self.secret_names:
+                raise ValueError(f"No secrets set for {exchange_name}")
+        if len(pending) == 1:
+            self.update_secret(pending[0], **kwargs)
+            return
+
+        client = self._get_client()
+        batch_get = getattr(client, "batch_get_secret_value", None)
+        if batch_get is None:
+            self._retrieve_secrets_threaded(pending)
+            return
+
+        self._retrieve_secrets_batched(batch_get, pending)
+        missing = [name for name in pending if name not in self.secrets]
+        if missing:
+            raise ValueError(f"No secrets found for {', '.join(missing)}")
+
+    def _retrieve_secrets_threaded(self, pending: list[str]) -> None:
+        """Fetch secrets for multiple exchanges with parallel single fetches.
+
+        Fallback for clients without batch_get_secret_value; boto3 is
+        thread-safe, so the round-trips are overlapped instead of batched.
+
+        Args:
+            pending (list[str]): Exchange names not yet in the cache
+        """
+        with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+            for exchange_name, exchange_secrets in zip(
+                pending, executor.map(self.retrieve_secrets, pending), strict=True
+            ):
+                self.secrets[exchange_name] = exchange_secrets
+
+    def _retrieve_secrets_batched(self, batch_get: Any, pending: list[str]) -> None:
+        """Fetch secrets for multiple exchanges via batch_get_secret_value.
+
+        Requests 20 secret ids per call (the API maximum) and follows
+        NextToken pagination within each batch.
+
+        Args:
+            batch_get (Any): The client's batch_get_secret_value method
+            pending (list[str]): Exchange names not yet in the cache
+        """
+        id_to_exchange = {self.secret_names[name]: name for name in pending}
+        secret_ids = list(id_to_exchange)
+        for start in range(0, len(secret_ids), 20):
+            params: dict[str, Any] = {"SecretIdList": secret_ids[start : start + 20]}
+            while True:
+                response = batch_get(**params)
+                for value in response.get("SecretValues", ()):
+                    exchange_name = id_to_exchange[value["Name"]]
+                    dict_secrets: dict[str, Any] = _loads(value["SecretString"])
+                    dict_secrets["name"] = exchange_name
+                    self.secrets[exchange_name] = self._format_secrets(
+                        value["Name"], dict_secrets
+                    )
+                next_token = response.get("NextToken")
+                if not next_token:
+                    break
+                params["NextToken"] = next_token
+
+    def _get_client(self) -> Any:
+        """Get the Secrets Manager client, building it on first use.
+
+        Session and client construction load service models and resolve
+        credentials — tens of milliseconds — so the client is created once
+        per instance and reused across secret fetches.
+
+        Returns:
+            Any: The cached boto3 secretsmanager client
+        """
+        if self._client is None:
+            session = boto3.session.Session(profile_name=self.profile_name)
+            self._client = session.client(
+                service_name="secretsmanager", region_name=session.region_name
+            )
+        return self._client
+
     def get_aws_secret(
         self, secret_name: str
     ) -> dict[str, dict[str, Any] | str | list[dict[str, Any]]]:
@@ -134,16 +268,13 @@ class AWSExchangeSecrets(ExchangesSecrets):
         Raises:
             ValueError: If the secret is not a valid JSON string
         """
-        session = boto3.session.Session(profile_name=self.profile_name)
-        client = session.client(
-            service_name="secretsmanager", region_name=session.region_name
-        )
+        client = self._get_client()
 
         get_secret_value_response = client.get_secret_value(SecretId=secret_name)
 
         if "SecretString" in get_secret_value_response:
             secret_str: str = get_secret_value_response["SecretString"]
-            secret: dict[str, dict[str, Any] | str | list[dict[str, Any]]] = json.loads(
+            secret: dict[str, dict[str, Any] | str | list[dict[str, Any]]] = _loads(
                 secret_str
             )
         else:
@@ -84,9 +84,19 @@ class ExchangesSecrets(BaseModel):
 
     Attributes:
         secrets (dict[str, ExchangeSecrets]): Cache of retrieved exchange credentials
+        trust_source (bool): Skip re-validation of payloads from sources that
+            already validated successfully once; leave False for payloads
+            that are not fully under your control
     """
 
     secrets: dict[str, ExchangeSecrets] = Field(default_factory=dict)
+    trust_source: bool = Field(
+        default=False,
+        description=(
+            "Allow backends to bypass pydantic validation for payloads whose "
+            "source has already validated successfully once"
+        ),
+    )
 
     def update_secret(self, exchange_name: str, **kwargs: Any) -> ExchangeSecrets:
         """Update or retrieve credentials for a specific exchange.
@@ -1,10 +1,19 @@
 import json
 import os
-from typing import Any
+from typing import Any, ClassVar
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr, SecretStr
 
-from financepype.secrets.base import ExchangeSecrets, ExchangesSecrets
+from financepype.secrets.base import (
+    ExchangeSecrets,
+    ExchangesSecrets,
+    SubaccountSecrets,
+)
+
+try:  # orjson parses multi-KB secret payloads ~2-3x faster when installed
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
 
 
 class LocalExchangeSecrets(ExchangesSecrets):
@@ -20,6 +29,11 @@ class LocalExchangeSecrets(ExchangesSecrets):
 
     file_path: str
 
+    _validated_paths: ClassVar[set[str]] = set()
+    _parsed_cache: tuple[int, dict[str, dict[str, Any]]] | None = PrivateAttr(
+        default=None
+    )
+
     class LocalFormatter(BaseModel):
         """Formats local JSON file data into ExchangeSecrets objects.
 
@@ -46,7 +60,29 @@ class LocalExchangeSecrets(ExchangesSecrets):
             KeyError: If the exchange is not found in the file
             FileNotFoundError: If the secrets file doesn't exist
         """
-        secrets = self.LocalFormatter.model_validate(self.get_local_secrets())
+        raw = self.get_local_secrets()
+        if self.trust_source and self.file_path in self._validated_paths:
+            # The file validated successfully before; build the models
+            # directly and wrap the credentials in SecretStr by hand.
+            payload = raw["exchange_secrets"][exchange_name]
+            subaccounts = {
+                name: SubaccountSecrets.model_construct(
+                    subaccount_name=subaccount["subaccount_name"],
+                    api_key=SecretStr(subaccount["api_key"]),
+                    api_secret=SecretStr(subaccount["api_secret"]),
+                    api_passphrase=(
+                        SecretStr(subaccount["api_passphrase"])
+                        if subaccount.get("api_passphrase") is not None
+                        else None
+                    ),
+                )
+                for name, subaccount in payload.get("subaccounts", {}).items()
+            }
+            return ExchangeSecrets.model_construct(
+                name=payload["name"], subaccounts=subaccounts
+            )
+        secrets = self.LocalFormatter.model_validate(raw)
+        self._validated_paths.add(self.file_path)
         return secrets.exchange_secrets[exchange_name]
 
     def get_local_secrets(self) -> dict[str, dict[str, Any]]:
@@ -62,6 +98,19 @@ class LocalExchangeSecrets(ExchangesSecrets):
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"File {self.file_path} not found")
 
-        with open(self.file_path) as file:
-            secrets: dict[str, dict[str, Any]] = json.load(file)
+        # Loading many exchanges hits this once per exchange; cache the
+        # parse and invalidate when the file's mtime changes.
+        mtime_ns = os.stat(self.file_path).st_mtime_ns
+        cached = self._parsed_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+
+        # Read as bytes so the parser works straight off the buffer,
+        # skipping the text-mode decode layer.
+        with open(self.file_path, "rb") as file:
+            raw = file.read()
+        secrets: dict[str, dict[str, Any]] = (
+            orjson.loads(raw) if orjson is not None else json.loads(raw)
+        )
+        self._parsed_cache = (mtime_ns, secrets)
         return secrets
@@ -1,5 +1,6 @@
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 from typing import cast
 
 import pandas as pd
@@ -22,22 +23,64 @@ from financepype.simulations.balances.engines.models import (
 from financepype.simulations.balances.engines.multiengine import BalanceMultiEngine
 
 
+@lru_cache(maxsize=128)
+def _get_platform(identifier: str) -> CentralizedPlatform:
+    """Get a cached platform instance for the given identifier."""
+    return CentralizedPlatform(identifier=identifier)
+
+
+@lru_cache(maxsize=128)
+def _get_trading_pair(name: str) -> TradingPair:
+    """Get a cached trading pair, skipping repeated name parsing."""
+    return TradingPair(name=name)
+
+
+@lru_cache(maxsize=128)
+def _get_trading_rule(trading_pair_name: str, is_spot: bool) -> TradingRule:
+    """Get a cached trading rule for the pair with the dashboard defaults.
+
+    Streamlit reruns the whole script on every widget interaction, so
+    without caching these models are validated from scratch on each rerun.
+    """
+    rule_cls = TradingRule if is_spot else DerivativeTradingRule
+    return rule_cls(
+        trading_pair=_get_trading_pair(trading_pair_name),
+        min_order_size=Decimal("0.0001"),
+        min_price_increment=Decimal("0.01"),
+        min_notional_size=Decimal("10"),
+    )
+
+
 def format_cashflows(cashflows: list[AssetCashflow]) -> pd.DataFrame:
     """Format cashflows into a DataFrame for visualization."""
-    data = []
+    # Build columns directly instead of one dict per row; pandas then
+    # assembles the frame from ready-made arrays without the dict-of-rows
+    # normalization pass.
+    assets: list[str] = []
+    phases: list[str] = []
+    types: list[str] = []
+    reasons: list[str] = []
+    amounts: list[Decimal | None] = []
     for cf in cashflows:
-        data.append(
-            {
-                "Asset": f"{cf.asset.side.value}:{cf.asset.identifier.value}"
-                if isinstance(cf.asset, DerivativeContract)
-                else cf.asset.identifier.value,
-                "Phase": cf.involvement_type.value,
-                "Type": cf.cashflow_type.value,
-                "Reason": cf.reason.value,
-                "Amount": cf.amount,
-            }
+        assets.append(
+            f"{cf.asset.side.value}:{cf.asset.identifier.value}"
+            if isinstance(cf.asset, DerivativeContract)
+            else cf.asset.identifier.value
         )
-    return pd.DataFrame(data, columns=["Asset", "Phase", "Type", "Reason", "Amount"])
+        phases.append(cf.involvement_type.value)
+        types.append(cf.cashflow_type.value)
+        reasons.append(cf.reason.value)
+        amounts.append(cf.amount)
+    return pd.DataFrame(
+        {
+            "Asset": assets,
+            "Phase": phases,
+            "Type": types,
+            "Reason": reasons,
+            "Amount": amounts,
+        },
+        copy=False,
+    )
 
 
 def main() -> None:
@@ -78,22 +121,9 @@ def main() -> None:
 
     # Sidebar for input parameters
     st.sidebar.header("Trading Parameters")
-    platform = CentralizedPlatform(identifier="exchange")
-    trading_pair_obj = TradingPair(name=trading_pair)
-    if trading_pair_obj.market_info.is_spot:
-        trading_rule = TradingRule(
-            trading_pair=trading_pair_obj,
-            min_order_size=Decimal("0.0001"),
-            min_price_increment=Decimal("0.01"),
-            min_notional_size=Decimal("10"),
-        )
-    else:
-        trading_rule = DerivativeTradingRule(
-            trading_pair=trading_pair_obj,
-            min_order_size=Decimal("0.0001"),
-            min_price_increment=Decimal("0.01"),
-            min_notional_size=Decimal("10"),
-        )
+    platform = _get_platform("exchange")
+    trading_pair_obj = _get_trading_pair(trading_pair)
+    trading_rule = _get_trading_rule(trading_pair, trading_pair_obj.market_info.is_spot)
 
     trade_type = st.sidebar.selectbox(
         "Trade Type",
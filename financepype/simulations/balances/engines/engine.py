@@ -229,13 +229,12 @@ class BalanceEngine(ABC):
             >>> print(result.opening_outflows)  # Opening costs
             >>> print(result.closing_inflows)   # Expected returns
         """
-        result = OperationSimulationResult(
+        cashflows: list[AssetCashflow] = []
+        cashflows.extend(cls.get_opening_outflows(operation_details))
+        cashflows.extend(cls.get_opening_inflows(operation_details))
+        cashflows.extend(cls.get_closing_outflows(operation_details))
+        cashflows.extend(cls.get_closing_inflows(operation_details))
+        return OperationSimulationResult(
             operation_details=operation_details,
-            cashflows=[
-                *cls.get_opening_outflows(operation_details),
-                *cls.get_opening_inflows(operation_details),
-                *cls.get_closing_outflows(operation_details),
-                *cls.get_closing_inflows(operation_details),
-            ],
+            cashflows=cashflows,
         )
-        return result
@@ -180,6 +180,16 @@ class BalanceTracker:
         self._track_history = track_history
         self._allow_negative = allow_negative
         self._balance_history: list[BalanceChange] = []
+        self._total_balances_version = 0
+
+    @property
+    def total_balances_version(self) -> int:
+        """Counter bumped on every total-balance mutation.
+
+        Callers caching a derived view of ``total_balances`` can compare
+        versions to detect staleness instead of diffing the mapping.
+        """
+        return self._total_balances_version
 
     @property
     def balance_history(self) -> Sequence[BalanceChange]:
@@ -277,6 +287,8 @@ class BalanceTracker:
             balance_dict[asset] += amount
         else:
             balance_dict[asset] = amount
+        if balance_type == BalanceType.TOTAL:
+            self._total_balances_version += 1
 
     def remove_balance(
         self, asset: Asset, amount: Decimal, reason: str, balance_type: BalanceType
@@ -323,6 +335,8 @@ class BalanceTracker:
         balance_dict[asset] -= amount
         if not self._allow_negative and balance_dict[asset] <= s_decimal_0:
             del balance_dict[asset]
+        if balance_type == BalanceType.TOTAL:
+            self._total_balances_version += 1
 
     def set_balance(
         self, asset: Asset, amount: Decimal, reason: str, balance_type: BalanceType
@@ -362,6 +376,8 @@ class BalanceTracker:
         )
         change_amount = amount - balance_dict.get(asset, s_decimal_0)
         balance_dict[asset] = amount
+        if balance_type == BalanceType.TOTAL:
+            self._total_balances_version += 1
         balance_change = BalanceChange(
             asset=asset,
             amount=change_amount,
@@ -429,16 +445,23 @@ class BalanceTracker:
         return balance_changes
 
     def set_position(
-        self, position: Position, reason: str, balance_type: BalanceType
+        self, position: Position, reason: str, balance_type: BalanceType | None = None
     ) -> None:
         """Set a position's size and update balances accordingly.
 
         Args:
             position: The position to set
             reason: Description of why the position is being set
-            balance_type: Whether to update total or available balance
+            balance_type: Whether to update total or available balance;
+                None updates both in a single call
         """
-        self.set_balance(position.asset, position.amount, reason, balance_type)
+        if balance_type is None:
+            self.set_balance(position.asset, position.amount, reason, BalanceType.TOTAL)
+            self.set_balance(
+                position.asset, position.amount, reason, BalanceType.AVAILABLE
+            )
+        else:
+            self.set_balance(position.asset, position.amount, reason, balance_type)
         self._positions[position.asset] = position
 
     def get_position(self, asset: DerivativeContract) -> Position | None:
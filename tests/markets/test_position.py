@@ -445,3 +445,33 @@ def test_model_validation(long_contract: DerivativeContract) -> None:
         "entry_price",
         "margin",
     }  # All invalid fields should be caught
+
+
+def test_position_book_vectorized_risk(
+    long_position: Position, short_position: Position
+) -> None:
+    """Test that PositionBook matches the per-position calculations."""
+    import numpy as np
+
+    from financepype.markets.position import PositionBook
+
+    book = PositionBook([long_position, short_position])
+    assert len(book) == 2
+
+    prices = np.array([48000.0, 52000.0])
+    distances = book.distance_from_liquidation(prices)
+    assert distances[0] == pytest.approx(
+        float(long_position.distance_from_liquidation(Decimal("48000")))
+    )
+    assert distances[1] == pytest.approx(
+        float(short_position.distance_from_liquidation(Decimal("52000")))
+    )
+
+    percentages = book.percentage_from_liquidation(prices)
+    assert percentages[0] == pytest.approx(
+        float(long_position.percentage_from_liquidation(Decimal("48000")))
+    )
+
+    risk_mask = book.is_at_liquidation_risk(max_fraction=0.95)
+    assert risk_mask[0] == long_position.is_at_liquidation_risk(Decimal("48000"))
+    assert risk_mask[1] == short_position.is_at_liquidation_risk(Decimal("52000"))
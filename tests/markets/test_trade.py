@@ -101,3 +101,11 @@ def test_public_trade_equality(valid_trade_data: dict[str, Any]) -> None:
     modified_data["trade_id"] = "789012"
     trade3 = PublicTrade(**modified_data)
     assert trade1 != trade3
+
+
+def test_public_trade_from_feed(valid_trade_data: dict[str, Any]) -> None:
+    """Test the trusted fast-path constructor used for feed ingestion."""
+    trade = PublicTrade.from_feed(**valid_trade_data)
+    assert trade == PublicTrade(**valid_trade_data)
+    assert trade.price == valid_trade_data["price"]
+    assert trade.amount == valid_trade_data["amount"]
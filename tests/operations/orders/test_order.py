@@ -152,6 +152,36 @@ def test_order_operation_update_with_trade_update(
     assert test_order.average_executed_price == Decimal("50000")
 
 
+def test_order_operation_approx_average_price_tracks_fills(
+    test_order: OrderOperation, test_quote_asset: SpotAsset
+) -> None:
+    """Test that the float approximation follows fills applied after construction."""
+    assert test_order.approx_average_executed_price is None
+
+    fee = OperationFee(
+        amount=Decimal("1"),
+        asset=test_quote_asset,
+        fee_type=FeeType.PERCENTAGE,
+        impact_type=FeeImpactType.ADDED_TO_COSTS,
+    )
+    trade_update = TradeUpdate(
+        trade_id="trade_1",
+        client_order_id="test_order_1",
+        exchange_order_id="ex_order_1",
+        trading_pair=test_order.trading_pair,
+        trade_type=TradeType.BUY,
+        fill_timestamp=1640995400.0,
+        fill_price=Decimal("50000"),
+        fill_base_amount=Decimal("0.5"),
+        fill_quote_amount=Decimal("25000"),
+        fee=fee,
+    )
+    test_order.process_operation_update(trade_update)
+
+    assert test_order.average_executed_price == Decimal("50000")
+    assert test_order.approx_average_executed_price == pytest.approx(50000.0)
+
+
 def test_order_operation_complete_fill(
     test_order: OrderOperation, test_quote_asset: SpotAsset
 ) -> None:
@@ -48,6 +48,7 @@ def mock_transaction():
     transaction = Mock(spec=BlockchainTransaction)
     transaction.client_operation_id = "test_client_id"
     transaction.client_transaction_id = "test_client_id"
+    transaction.operator_operation_id = None
     transaction.transaction_id = MockBlockchainIdentifier(
         string="test_tx_id", raw=b"test_tx_id"
     )
@@ -6,6 +6,7 @@ from financepype.assets.asset import Asset
 from financepype.assets.spot import SpotAsset
 from financepype.owners.owner import Owner, OwnerConfiguration, OwnerIdentifier
 from financepype.platforms.platform import Platform
+from financepype.simulations.balances.tracking.tracker import BalanceType
 
 
 class MockOwner(Owner):
@@ -64,6 +65,34 @@ def test_owner_get_balances(
     assert updated_available == {"BTC": Decimal("1.0"), "USDT": Decimal("800")}
 
 
+def test_owner_get_balance_sees_direct_tracker_updates(
+    owner: Owner, btc_asset: SpotAsset, usdt_asset: SpotAsset
+) -> None:
+    # Prime the balances through the owner
+    owner.set_balances(
+        total_balances=[(btc_asset, Decimal("1.5"))],
+        available_balances=[(btc_asset, Decimal("1.0"))],
+        complete_snapshot=True,
+    )
+    assert owner.get_balance("BTC") == Decimal("1.5")
+
+    # Mutate the tracker directly; get_balance must not serve stale values
+    owner.balance_tracker.add_balance(
+        btc_asset, Decimal("5"), "deposit", BalanceType.TOTAL
+    )
+    assert owner.get_balance("BTC") == Decimal("6.5")
+
+    owner.balance_tracker.set_balance(
+        usdt_asset, Decimal("1000"), "deposit", BalanceType.TOTAL
+    )
+    assert owner.get_balance("USDT") == Decimal("1000")
+
+    owner.balance_tracker.remove_balance(
+        btc_asset, Decimal("6.5"), "withdrawal", BalanceType.TOTAL
+    )
+    assert owner.get_balance("BTC") == Decimal("0")
+
+
 def test_owner_get_all_balances(
     owner: Owner, btc_asset: SpotAsset, usdt_asset: SpotAsset
 ) -> None:
@@ -270,3 +270,43 @@ def test_derivative_rule_serialization_and_deserialization(
         == derivative_rule.sell_order_collateral_token
     )
     assert deserialized_rule.is_live == derivative_rule.is_live
+
+
+def test_bulk_from_payload() -> None:
+    """Test bulk construction of rules from pre-validated payloads."""
+    rules = TradingRule.bulk_from_payload(
+        [
+            {
+                "trading_pair": "BTC-USDT",
+                "min_order_size": "0.001",
+                "min_price_increment": 0.01,
+            },
+            {"trading_pair": "ETH-USDT"},
+        ]
+    )
+
+    assert len(rules) == 2
+    assert rules[0].trading_pair == TradingPair(name="BTC-USDT")
+    assert rules[0].min_order_size == Decimal("0.001")
+    assert rules[0].min_price_increment == Decimal("0.01")
+    assert rules[0].buy_order_collateral_token == "USDT"
+    assert rules[0].sell_order_collateral_token == "BTC"
+
+    # Unspecified fields fall back to the model defaults
+    reference = TradingRule(trading_pair=TradingPair(name="ETH-USDT"))
+    assert rules[1].max_order_size == reference.max_order_size
+    assert rules[1].supported_order_types == reference.supported_order_types
+
+
+def test_bulk_from_payload_derivative() -> None:
+    """Test that the bulk path honors subclass collateral defaulting."""
+    (rule,) = DerivativeTradingRule.bulk_from_payload(
+        [{"trading_pair": "BTC-USDT-PERPETUAL"}]
+    )
+    reference = DerivativeTradingRule(
+        trading_pair=TradingPair(name="BTC-USDT-PERPETUAL")
+    )
+
+    assert rule.perpetual is True
+    assert rule.buy_order_collateral_token == reference.buy_order_collateral_token
+    assert rule.sell_order_collateral_token == reference.sell_order_collateral_token
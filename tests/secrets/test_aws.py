@@ -121,3 +121,110 @@ def test_retrieve_secrets_aws_error(
 
     with pytest.raises(ValueError, match="No secrets found for test_exchange"):
         aws_secrets.retrieve_secrets("test_exchange")
+
+
+def _secret_payload(exchange_name: str) -> dict[str, Any]:
+    return {
+        "name": exchange_name,
+        "API_KEY": f"{exchange_name}_key",
+        "API_SECRET": f"{exchange_name}_secret",
+        "SUBACCOUNTS": [],
+    }
+
+
+@pytest.fixture
+def multi_aws_secrets(mock_aws_client: MagicMock) -> AWSExchangeSecrets:
+    return AWSExchangeSecrets(
+        profile_name="test_profile",
+        secret_names={
+            "exchange_a": "secret_a",
+            "exchange_b": "secret_b",
+        },
+    )
+
+
+def test_update_secrets_batched(
+    multi_aws_secrets: AWSExchangeSecrets, mock_aws_client: MagicMock
+) -> None:
+    """Test that update_secrets uses batch_get_secret_value when available."""
+    mock_aws_client.batch_get_secret_value.return_value = {
+        "SecretValues": [
+            {"Name": "secret_a", "SecretString": json.dumps(_secret_payload("a"))},
+            {"Name": "secret_b", "SecretString": json.dumps(_secret_payload("b"))},
+        ]
+    }
+
+    multi_aws_secrets.update_secrets(["exchange_a", "exchange_b"])
+
+    assert multi_aws_secrets.get_secret("exchange_a").name == "exchange_a"
+    assert multi_aws_secrets.get_secret("exchange_b").name == "exchange_b"
+    mock_aws_client.batch_get_secret_value.assert_called_once_with(
+        SecretIdList=["secret_a", "secret_b"]
+    )
+    mock_aws_client.get_secret_value.assert_not_called()
+
+
+def test_update_secrets_batched_pagination(
+    multi_aws_secrets: AWSExchangeSecrets, mock_aws_client: MagicMock
+) -> None:
+    """Test that update_secrets follows NextToken pagination."""
+    mock_aws_client.batch_get_secret_value.side_effect = [
+        {
+            "SecretValues": [
+                {"Name": "secret_a", "SecretString": json.dumps(_secret_payload("a"))}
+            ],
+            "NextToken": "token_1",
+        },
+        {
+            "SecretValues": [
+                {"Name": "secret_b", "SecretString": json.dumps(_secret_payload("b"))}
+            ]
+        },
+    ]
+
+    multi_aws_secrets.update_secrets(["exchange_a", "exchange_b"])
+
+    assert multi_aws_secrets.get_secret("exchange_a").name == "exchange_a"
+    assert multi_aws_secrets.get_secret("exchange_b").name == "exchange_b"
+    assert mock_aws_client.batch_get_secret_value.call_count == 2
+    _, second_call = mock_aws_client.batch_get_secret_value.call_args_list
+    assert second_call.kwargs["NextToken"] == "token_1"
+
+
+def test_update_secrets_batched_missing_secret(
+    multi_aws_secrets: AWSExchangeSecrets, mock_aws_client: MagicMock
+) -> None:
+    """Test that a secret missing from the batch response raises ValueError."""
+    mock_aws_client.batch_get_secret_value.return_value = {
+        "SecretValues": [
+            {"Name": "secret_a", "SecretString": json.dumps(_secret_payload("a"))}
+        ]
+    }
+
+    with pytest.raises(ValueError, match="No secrets found for exchange_b"):
+        multi_aws_secrets.update_secrets(["exchange_a", "exchange_b"])
+
+
+def test_update_secrets_threaded_fallback(
+    multi_aws_secrets: AWSExchangeSecrets, mock_aws_client: MagicMock
+) -> None:
+    """Test the thread-pool fallback when the client cannot batch."""
+    # Restrict the mock so batch_get_secret_value does not exist
+    mock_aws_client.mock_add_spec(["get_secret_value"])
+    mock_aws_client.get_secret_value.side_effect = lambda SecretId: {
+        "SecretString": json.dumps(_secret_payload(SecretId.removeprefix("secret_")))
+    }
+
+    multi_aws_secrets.update_secrets(["exchange_a", "exchange_b"])
+
+    assert multi_aws_secrets.get_secret("exchange_a").name == "exchange_a"
+    assert multi_aws_secrets.get_secret("exchange_b").name == "exchange_b"
+    assert mock_aws_client.get_secret_value.call_count == 2
+
+
+def test_update_secrets_not_configured(
+    multi_aws_secrets: AWSExchangeSecrets,
+) -> None:
+    """Test that an unconfigured exchange name raises ValueError."""
+    with pytest.raises(ValueError, match="No secrets set for nonexistent"):
+        multi_aws_secrets.update_secrets(["exchange_a", "nonexistent"])